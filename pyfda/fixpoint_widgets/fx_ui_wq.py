@@ -10,7 +10,11 @@
 Helper classes and functions for generating and simulating fixpoint filters
 """
 import sys
-import inspect
+import re
+from contextlib import contextmanager
+from functools import lru_cache
+from math import ldexp
+from types import MappingProxyType
 
 # from numpy.lib.function_base import iterable
 
@@ -20,7 +24,7 @@ import pyfda.libs.pyfda_fix_lib as fx
 
 from pyfda.libs.compat import (
     Qt, QWidget, QLabel, QLineEdit, QComboBox, QPushButton, QIcon,
-    QVBoxLayout, QHBoxLayout, QGridLayout, QFrame, pyqtSignal)
+    QVBoxLayout, QHBoxLayout, QGridLayout, QFrame, QSignalBlocker, QTimer, pyqtSignal)
 
 from pyfda.libs.pyfda_qt_lib import (
     qcmb_box_populate, qget_cmb_box, qset_cmb_box, qstyle_widget)
@@ -30,6 +34,86 @@ from pyfda.libs.pyfda_lib import safe_eval, to_html
 import logging
 logger = logging.getLogger(__name__)
 
+# Default combo box items with tooltips (see `pyfda_qt_lib.qcmb_box_populate()`),
+# shared by all instances of `FX_UI_WQ`
+_CMB_Q = ["Select the kind of quantization.",
+          ("round", "Round",
+           "<span>Round towards nearest representable number</span>"),
+          ("fix", "Fix", "Round towards zero"),
+          ("floor", "Floor", "<span>Round towards negative infinity / "
+           "two's complement truncation.</span>"),
+          ("none", "None",
+           "<span>No quantization (only for debugging)</span>")]
+_CMB_OV = ["<span>Select overflow behaviour.</span>",
+           ("wrap", "Wrap", "Two's complement wrap around"),
+           ("sat", "Sat",
+            "<span>Saturation, i.e. limit at min. / max. value</span>"),
+           ("none", "None",
+            "<span>No overflow behaviour (only for debugging)</span>")]
+_CMB_W = ["<span>Select word format manually / automatically</span>",
+          ("m", "M", "<span><b>Manual</b> entry of integer and fractional "
+           "word length.</span>"),
+          ("a", "A", "<span><b>Automatic</b> estimation of required integer "
+           "and fractional word length.</span>")]
+
+# Settings of the WI / WF subwidgets for all combinations of quantization format
+# `qfrmt` and word format selection `w_a_m`:
+#   (ledWI / ledWF visible, ledWI / ledWF enabled, label between WI and WF)
+_VIS_TABLE = {(qfrmt, w_a_m): (qfrmt != 'float', w_a_m == 'm', to_html(sep, frmt='b'))
+              for qfrmt, sep in (('qint', '('), ('qfrac', '.'), ('float', '---'))
+              for w_a_m in ('m', 'a', 'f')}
+# fallback for unknown settings, separator label is not changed
+_VIS_DEFAULT = (True, False, None)
+
+
+# one or two ASCII decimal digits, the normal contents of the word length fields
+_DIGITS_RE = re.compile(r'[0-9]{1,2}')
+
+
+# ------------------------------------------------------------------------------
+def _fast_int(expr, alt_expr) -> int:
+    """
+    Convert `expr` (string or number) from a word length lineedit field or a
+    quantization dict to a positive integer. Values consisting of one or two
+    decimal digits (the normal case) are converted directly, everything else is
+    evaluated by `safe_eval()` with the fallback `alt_expr`.
+    """
+    expr = str(expr).strip()
+    if _DIGITS_RE.fullmatch(expr):
+        return int(expr)
+    return int(safe_eval(expr, alt_expr, return_type="int", sign='poszero'))
+
+
+# ------------------------------------------------------------------------------
+@lru_cache(maxsize=64)
+def _fmt_ovfl(N_over: int) -> str:
+    """ Return the HTML text for the overflow counter label, cached for small counts """
+    return to_html(f"<b><i>&nbsp;&nbsp;N_ov </i>= {N_over}</b>")
+
+
+# ------------------------------------------------------------------------------
+# Setters for Qt widget properties, skipping the call (and the triggered repaint,
+# signals etc.) when the property already has the requested value
+def _set_text_if(wdg, text: str) -> None:
+    """ Set text of widget `wdg` if it differs from the current text """
+    if wdg.text() != text:
+        wdg.setText(text)
+
+
+def _set_visible_if(wdg, visible: bool) -> None:
+    """ Show / hide widget `wdg` if it is not shown / hidden yet """
+    if wdg.isHidden() == visible:
+        wdg.setVisible(visible)
+
+
+def _set_enabled_if(wdg, enabled: bool) -> None:
+    """
+    Enable / disable widget `wdg` if it is not enabled / disabled yet. The explicit
+    `WA_Disabled` attribute is tested as `isEnabled()` also depends on the parent.
+    """
+    if wdg.testAttribute(Qt.WA_Disabled) == enabled:
+        wdg.setEnabled(enabled)
+
 
 # ------------------------------------------------------------------------------
 class FX_UI_WQ(QWidget):
@@ -95,6 +179,22 @@ class FX_UI_WQ(QWidget):
     sig_tx = pyqtSignal(object)  # outcgoing
     from pyfda.libs.pyfda_qt_lib import emit
 
+    # default widget settings (read-only), see docstring above
+    _DEFAULT_UI = MappingProxyType(
+        {'wdg_name': 'fx_ui_wq', 'label': '',
+         'label_q': 'Quant.', 'cmb_q_items': _CMB_Q,
+         'label_ov': 'Ovfl.', 'cmb_ov_items': _CMB_OV,
+         #
+         'lbl_sep': '.', 'max_led_width': 30,
+         'WI_len': 2, 'tip_WI': 'Number of integer bits',
+         'WF_len': 2, 'tip_WF': 'Number of fractional bits',
+         'fractional': True,
+         'cmb_w_vis': 'on', 'cmb_w_items': _CMB_W,
+         'lock_vis': 'off',
+         'tip_lock': '<span>Sync input and output quantization formats.</span>',
+         'count_ovfl_vis': 'auto', 'MSB_LSB_vis': 'off'
+         })
+
     def __init__(self, q_dict: dict, **kwargs) -> None:
         super().__init__()
 
@@ -104,6 +204,10 @@ class FX_UI_WQ(QWidget):
         # merge 'q_dict_default' into 'q_dict', prioritizing 'q_dict' entries
         merge_dicts_hierarchically(q_dict, q_dict_default)
         self.q_dict = q_dict
+        # buffer for signals collected during `suppress()`, `None` when not suppressing
+        self._sig_buffer = None
+        # flag for skipping nested calls of `update_WI_WF()`
+        self._updating_WI_WF = False
 
         self._construct_UI(**kwargs)
 
@@ -121,48 +225,12 @@ class FX_UI_WQ(QWidget):
     # --------------------------------------------------------------------------
     def _construct_UI(self, **kwargs):
         """ Construct widget """
-        cmb_q = ["Select the kind of quantization.",
-                 ("round", "Round",
-                  "<span>Round towards nearest representable number</span>"),
-                 ("fix", "Fix", "Round towards zero"),
-                 ("floor", "Floor", "<span>Round towards negative infinity / "
-                  "two's complement truncation.</span>"),
-                 ("none", "None",
-                  "<span>No quantization (only for debugging)</span>")]
-        cmb_ov = ["<span>Select overflow behaviour.</span>",
-                  ("wrap", "Wrap", "Two's complement wrap around"),
-                  ("sat", "Sat",
-                   "<span>Saturation, i.e. limit at min. / max. value</span>"),
-                  ("none", "None",
-                   "<span>No overflow behaviour (only for debugging)</span>")]
-        cmb_w = ["<span>Select word format manually / automatically</span>",
-                ("m", "M", "<span><b>Manual</b> entry of integer and fractional "
-                "word length.</span>"),
-                ("a", "A", "<span><b>Automatic</b> estimation of required integer "
-                 "and fractional word length.</span>")                 ]
-        # default widget settings:
-        ui_dict = {'wdg_name': 'fx_ui_wq', 'label': '',
-                   'label_q': 'Quant.', 'cmb_q_items': cmb_q,
-                   'label_ov': 'Ovfl.', 'cmb_ov_items': cmb_ov,
-                   #
-                   'lbl_sep': '.', 'max_led_width': 30,
-                   'WI_len': 2, 'tip_WI': 'Number of integer bits',
-                   'WF_len': 2, 'tip_WF': 'Number of fractional bits',
-                   'fractional': True,
-                   'cmb_w_vis': 'on', 'cmb_w_items': cmb_w,
-                   'lock_vis': 'off',
-                   'tip_lock':
-                       '<span>Sync input and output quantization formats.</span>',
-                   'count_ovfl_vis': 'auto', 'MSB_LSB_vis': 'off'
-                   }
-
-        # update local `ui_dict` with keyword arguments passed during construction
-        for key, val in kwargs.items():
-            if key not in ui_dict:
-                logger.warning(f"Unknown key '{key}'")
-            else:
-                ui_dict.update({key: val})
-        # ui_dict.update(map(kwargs)) # same as above?
+        for key in kwargs.keys() - self._DEFAULT_UI.keys():
+            logger.warning(f"Unknown key '{key}'")
+        # create local `ui_dict` from default settings, updated with valid keyword
+        # arguments passed during construction
+        ui_dict = {**self._DEFAULT_UI,
+                   **{k: v for k, v in kwargs.items() if k in self._DEFAULT_UI}}
 
         self.wdg_name = ui_dict['wdg_name']
         lbl_wdg = QLabel(ui_dict['label'], self)
@@ -275,21 +343,24 @@ class FX_UI_WQ(QWidget):
         # ----------------------------------------------------------------------
         # INITIAL SETTINGS OF UI AND FIXPOINT QUANTIZATION OBJECT
         # ----------------------------------------------------------------------
-        WI = int(self.q_dict['WI'])
-        WF = int(self.q_dict['WF'])
-        W = WI + WF + 1
-        self.ledWI.setText(str(WI))
-        self.ledWF.setText(str(WF))
-
-        self.q_dict.update({'ovfl': qget_cmb_box(self.cmbOvfl),
-                            'quant': qget_cmb_box(self.cmbQuant),
-                            'w_a_m': qget_cmb_box(self.cmbW),
-                            'WI': WI, 'WF': WF})
-        # create fixpoint quantization object from passed quantization dict
-        self.QObj = fx.Fixed(self.q_dict)
-
-        # initialize button icon
-        self.butLock_clicked(self.butLock.isChecked())
+        # Signals of the subwidgets are blocked during initialization, otherwise
+        # slots connected later on (e.g. when the UI is reconstructed) might be
+        # triggered by the initial values
+        with self.suppress():
+            WI = int(self.q_dict['WI'])
+            WF = int(self.q_dict['WF'])
+            self.ledWI.setText(str(WI))
+            self.ledWF.setText(str(WF))
+
+            self.q_dict.update({'ovfl': qget_cmb_box(self.cmbOvfl),
+                                'quant': qget_cmb_box(self.cmbQuant),
+                                'w_a_m': qget_cmb_box(self.cmbW),
+                                'WI': WI, 'WF': WF})
+            # create fixpoint quantization object from passed quantization dict
+            self.QObj = fx.Fixed(self.q_dict)
+
+            # initialize button icon
+            self.butLock_clicked(self.butLock.isChecked())
 
         # ----------------------------------------------------------------------
         # GLOBAL SIGNALS
@@ -298,11 +369,19 @@ class FX_UI_WQ(QWidget):
         # ----------------------------------------------------------------------
         # LOCAL SIGNALS & SLOTs
         # ----------------------------------------------------------------------
-        self.cmbOvfl.currentIndexChanged.connect(self.ui2dict)
-        self.cmbQuant.currentIndexChanged.connect(self.ui2dict)
-        self.ledWI.editingFinished.connect(self.ui2dict)
-        self.ledWF.editingFinished.connect(self.ui2dict)
-        self.cmbW.currentIndexChanged.connect(self.ui2dict)
+        # Changes of the subwidgets are collected by `queue_ui2dict()`, `ui2dict()`
+        # is called only once per event loop iteration by a zero-delay timer
+        self._ui2dict_senders = []
+        self._ui2dict_timer = QTimer(self)
+        self._ui2dict_timer.setSingleShot(True)
+        self._ui2dict_timer.setInterval(0)
+        self._ui2dict_timer.timeout.connect(self._flush_ui2dict)
+
+        self.cmbOvfl.currentIndexChanged.connect(self.queue_ui2dict)
+        self.cmbQuant.currentIndexChanged.connect(self.queue_ui2dict)
+        self.ledWI.editingFinished.connect(self.queue_ui2dict)
+        self.ledWF.editingFinished.connect(self.queue_ui2dict)
+        self.cmbW.currentIndexChanged.connect(self.queue_ui2dict)
 
         self.butLock.clicked.connect(self.butLock_clicked)
 
@@ -322,40 +401,97 @@ class FX_UI_WQ(QWidget):
             self.butLock.setIcon(QIcon(':/lock-unlocked.svg'))
 
         dict_sig = {'wdg_name': self.wdg_name, 'ui_local_changed': 'butLock'}
-        self.emit(dict_sig)
+        self.emit_local(dict_sig)
+
+    # --------------------------------------------------------------------------
+    @contextmanager
+    def suppress(self):
+        """
+        Context manager for bulk updates of the UI: Block the signals of the
+        subwidgets and collect the `'ui_local_changed'` signals emitted by this
+        widget in the meantime. When leaving the outermost context, only the last
+        collected signal is emitted ("last one wins").
+
+        Usage: `with self.wdg_wq_accu.suppress(): ...`
+        """
+        blockers = [QSignalBlocker(w) for w in (self.cmbW, self.cmbOvfl, self.cmbQuant,
+                                                self.ledWI, self.ledWF)]
+        outermost = self._sig_buffer is None
+        if outermost:
+            self._sig_buffer = {}
+        try:
+            yield
+        finally:
+            for b in blockers:
+                b.unblock()  # restore previous blocking state of subwidget
+            if outermost:
+                sig_buffer, self._sig_buffer = self._sig_buffer, None
+                for dict_sig in sig_buffer.values():
+                    self.emit(dict_sig)
+
+    # --------------------------------------------------------------------------
+    def emit_local(self, dict_sig: dict) -> None:
+        """
+        Emit `dict_sig` or store it in the signal buffer, deduplicated by the
+        `'wdg_name'` key, when signals are suppressed (see `suppress()`).
+        """
+        if self._sig_buffer is None:
+            self.emit(dict_sig)
+        else:
+            self._sig_buffer[dict_sig['wdg_name']] = dict_sig
 
     # --------------------------------------------------------------------------
     def update_ovfl_cnt(self):
         """
         Update the overflow counter and MSB / LSB display (if visible)
         """
-        # -------
-        # frm = inspect.stack()[1]
-        # logger.warning(f"update: {id(self)}|{id(self.q_dict)} | {self.wdg_name} :"
-        #              f"{self.q_dict['N_over']} "
-        #              f"{inspect.getmodule(frm[0]).__name__.split('.')[-1]}."
-        #              f"{frm[3]}:{frm[2]}")
-
-        if self.count_ovfl_vis == 'off':
-            self.lbl_ovfl_count.setVisible(False)
-        elif self.count_ovfl_vis == 'auto' and self.q_dict['N_over'] == 0:
-            self.lbl_ovfl_count.setVisible(False)
+        if self.count_ovfl_vis == 'off' or\
+                self.count_ovfl_vis == 'auto' and self.q_dict['N_over'] == 0:
+            # nothing to display, label only needs to be hidden once
+            _set_visible_if(self.lbl_ovfl_count, False)
         elif self.count_ovfl_vis == 'on' or\
                 self.count_ovfl_vis == 'auto' and self.q_dict['N_over'] > 0:
 
-            self.lbl_ovfl_count.setVisible(True)
-            self.lbl_ovfl_count.setText(
-                to_html(f"<b><i>&nbsp;&nbsp;N_ov </i>= {self.q_dict['N_over']}</b>"))
-            if self.q_dict['N_over'] == 0:
-                qstyle_widget(self.lbl_ovfl_count, "normal")
-            else:
-                qstyle_widget(self.lbl_ovfl_count, "failed")
+            _set_visible_if(self.lbl_ovfl_count, True)
+            text = _fmt_ovfl(self.q_dict['N_over'])
+            # label style only depends on the count, skip it for an unchanged text
+            if text != self.lbl_ovfl_count.text():
+                self.lbl_ovfl_count.setText(text)
+                if self.q_dict['N_over'] == 0:
+                    qstyle_widget(self.lbl_ovfl_count, "normal")
+                else:
+                    qstyle_widget(self.lbl_ovfl_count, "failed")
         else:
             logger.error(f"Unknown option count_ovfl_vis = '{self.count_ovfl_vis}'")
         return
 
     # --------------------------------------------------------------------------
-    def ui2dict(self) -> None:
+    def queue_ui2dict(self) -> None:
+        """
+        Store the object name of the subwidget that triggered this slot and
+        (re)start the zero-delay timer for `ui2dict()`. This way, several
+        subwidget changes within one event loop iteration are processed at once.
+        """
+        if self.sender():
+            name = self.sender().objectName()
+            if name not in self._ui2dict_senders:
+                self._ui2dict_senders.append(name)
+        self._ui2dict_timer.start()
+
+    # --------------------------------------------------------------------------
+    def _flush_ui2dict(self) -> None:
+        """
+        Called by the timer, update the quantization dict once from the UI for all
+        queued subwidget changes. One signal is emitted per distinct sender (in the
+        order of their first change) as receivers react differently to them.
+        """
+        senders, self._ui2dict_senders = self._ui2dict_senders, []
+        self.ui2dict(senders[0] if senders else None)
+        for name in senders[1:]:
+            self.emit_local({'wdg_name': self.wdg_name, 'ui_local_changed': name})
+
+    # --------------------------------------------------------------------------
+    def ui2dict(self, sender_name: str = None) -> None:
         """
         Update the quantization dict `self.q_dict` (usually a reference to a part of a
         global quantization dict like `self.q_dict = fb.fil[0]['fxqc']['QCB']`)
@@ -364,20 +500,22 @@ class FX_UI_WQ(QWidget):
         These are the subwidgets for `ovfl`, `quant`, `WI`, `WF` which also
         trigger this method when edited.
 
-        Emit a signal with `{'ui_local_changed': <objectName of the sender>}`.
+        Emit a signal with `{'ui_local_changed': <objectName of the sender>}`. The
+        sender name is passed as `sender_name` when called via `queue_ui2dict()`.
         """
-        WF = int(safe_eval(self.ledWF.text(), self.QObj.q_dict['WF'], return_type="int",
-                           sign='poszero'))
-        self.ledWF.setText(str(WF))
+        if sender_name is None and self.sender():
+            sender_name = self.sender().objectName()
+
+        WF = _fast_int(self.ledWF.text(), self.QObj.q_dict['WF'])
+        _set_text_if(self.ledWF, str(WF))
 
-        WI = int(safe_eval(self.ledWI.text(), self.QObj.q_dict['WI'] + WF + 1, return_type="int",
-                           sign='poszero'))
+        WI = _fast_int(self.ledWI.text(), self.QObj.q_dict['WI'] + WF + 1)
         if fb.fil[0]['qfrmt'] == 'qint':
             if WI <= WF:
                 logger.warning(f"Total word length has to be larger than Fractional scaling WF = {WF}!")
                 WI = self.QObj.q_dict['WI'] + WF + 1
 
-        self.ledWI.setText(str(WI))
+        _set_text_if(self.ledWI, str(WI))
 
         # In 'qint' mode, the WI field shows the total word lenghth W. Nevertheless, the value
         # for 'WI' is stored in the dicts.
@@ -396,15 +534,13 @@ class FX_UI_WQ(QWidget):
 
         self.update_WI_WF()
 
-        if self.sender():
-            # logger.error(f"sender = {self.sender().objectName()}")
-#             if self.sender().objectName() == 'cmbW':
-#                self.enable_subwidgets()  # enable / disable WI and WF subwidgets
+        if sender_name:
             dict_sig = {'wdg_name': self.wdg_name,
-                        'ui_local_changed': self.sender().objectName()}
-            self.emit(dict_sig)
+                        'ui_local_changed': sender_name}
+            self.emit_local(dict_sig)
         else:
-            logger.error("Sender has no object name!")
+            # method has been called directly, not by a signal-slot connection
+            logger.debug("Sender has no object name!")
 
     # --------------------------------------------------------------------------
     def dict2ui(self, q_dict: dict = None) -> None:
@@ -420,7 +556,15 @@ class FX_UI_WQ(QWidget):
 
         If `q_dict is None`, use data from the instance quantization dict `self.q_dict`
         instead, this can be used to update the UI.
+
+        Signals of the subwidgets are blocked during the update, see `suppress()`.
         """
+        with self.suppress():
+            self._dict2ui(q_dict)
+
+    # --------------------------------------------------------------------------
+    def _dict2ui(self, q_dict: dict = None) -> None:
+        """ Update UI and quantization dicts, called by `dict2ui()` """
         if q_dict is None:
             q_dict = self.q_dict  # update UI from instance qdict
         else:
@@ -449,16 +593,11 @@ class FX_UI_WQ(QWidget):
         if qfrmt not in {'float', 'qfrac', 'qint'}:
             logger.error(f"Unknown quantization format '{qfrmt}'")
 
-        WI = safe_eval(
-            q_dict['WI'], self.QObj.q_dict['WI'], return_type="int", sign='poszero')
-        self.q_dict.update({'WI': WI})
-
-        self.ledWI.setText(str(WI))
-
-        WF = safe_eval(
-            q_dict['WF'], self.QObj.q_dict['WF'], return_type="int", sign='poszero')
-        self.ledWF.setText(str(WF))
-        self.q_dict.update({'WF': WF})
+        for key, led in (('WI', self.ledWI), ('WF', self.ledWF)):
+            if key in q_dict:
+                W = _fast_int(q_dict[key], self.QObj.q_dict[key])
+                self.q_dict.update({key: W})
+                _set_text_if(led, str(W))
 
         self.QObj.set_qdict(self.q_dict)  # update quantization object and derived parameters
 
@@ -469,44 +608,66 @@ class FX_UI_WQ(QWidget):
         """
         Update visibility / writability of integer and fractional part of the
         quantization format. depending on 'qfrmt' and 'w_a_m' settings
+
+        Nested calls (e.g. triggered by slots connected to the subwidgets) are
+        skipped, the outermost call already processes the current settings.
         """
+        if self._updating_WI_WF:
+            return
+        self._updating_WI_WF = True
+        try:
+            self._update_WI_WF()
+        finally:
+            self._updating_WI_WF = False
+
+    # --------------------------------------------------------------------------
+    def _update_WI_WF(self):
+        """ Update WI / WF widgets and MSB / LSB labels, called by `update_WI_WF()` """
         qfrmt = fb.fil[0]['qfrmt']
-        ## logger.error(f"{self.q_dict['wdg_name']}: {qfrmt}, self.w_a_m = {self.q_dict['w_a_m']}")
-        self.ledWI.setVisible(qfrmt != 'float')
-        self.ledWF.setVisible(qfrmt != 'float')
+        WI = self.q_dict['WI']
+        WF = self.q_dict['WF']
+
+        led_vis, led_en, lbl_sep = _VIS_TABLE.get(
+            (qfrmt, self.q_dict['w_a_m']), _VIS_DEFAULT)
+        _set_visible_if(self.ledWI, led_vis)
+        _set_visible_if(self.ledWF, led_vis)
+        _set_enabled_if(self.ledWI, led_en)
+        _set_enabled_if(self.ledWF, led_en)
+        if lbl_sep is not None:
+            self.lbl_sep1.setText(lbl_sep)
 
         if qfrmt == 'qint':
-            self.lbl_sep1.setText(to_html("(", frmt='b'))
             self.ledWF.setToolTip("Fractional position")
-            self.ledWI.setText(str(self.q_dict['WI'] + self.q_dict['WF'] + 1))
+            _set_text_if(self.ledWI, str(WI + WF + 1))
             self.ledWI.setToolTip("Total number of bits")
-
-            LSB = 1.
-            MSB = 2. ** (self.q_dict['WI'] + self.q_dict['WF'] - 1)
         elif qfrmt == "qfrac":
-            self.lbl_sep1.setText(to_html(".", frmt='b'))
             self.ledWF.setToolTip("Number of fractional bits")
-            self.ledWI.setText(str(self.q_dict['WI']))
+            _set_text_if(self.ledWI, str(WI))
             self.ledWI.setToolTip("Number of integer bits")
-
-            LSB = 2 ** -self.q_dict['WF']
-            MSB = 2. ** (self.q_dict['WI'] - 1) - LSB
-        elif qfrmt == 'float':
-            self.lbl_sep1.setText(to_html("---", frmt='b'))
-        else:
+        elif qfrmt != 'float':
             logger.error(f"Unknown quantization format '{qfrmt}'!")
 
-        self.ledWF.setText(str(self.q_dict['WF']))
+        _set_text_if(self.ledWF, str(WF))
+
+        if self.MSB_LSB_vis == 'off' or qfrmt not in {'qint', 'qfrac'}:
+            # Don't show any data, no need to calculate MSB / LSB
+            _set_visible_if(self.lbl_MSB, False)
+            _set_visible_if(self.lbl_LSB, False)
+            return
 
+        # calculate powers of two with `ldexp(1., n) = 2 ** n` (no float pow),
+        # integer weights in 'qint' format are calculated exactly by bit shifts
+        if qfrmt == 'qint':
+            LSB = 1
+            MSB = 1 << (WI + WF - 1) if WI + WF > 0 else 0.5
+        else:
+            LSB = ldexp(1., -WF)
+            MSB = ldexp(1., WI - 1) - LSB
 
-        if self.MSB_LSB_vis == 'off' or fb.fil[0]['qfrmt'] == 'float':
-            # Don't show any data
-            self.lbl_MSB.setVisible(False)
-            self.lbl_LSB.setVisible(False)
-        elif self.MSB_LSB_vis == 'max':
+        if self.MSB_LSB_vis == 'max':
             # Show MAX and LSB data
-            self.lbl_MSB.setVisible(True)
-            self.lbl_LSB.setVisible(True)
+            _set_visible_if(self.lbl_MSB, True)
+            _set_visible_if(self.lbl_LSB, True)
             self.lbl_MSB.setText(
                 "<b><i>&nbsp;&nbsp;Max</i><sub>10</sub> = </b>"
                 f"{2. * MSB - LSB:.{params['FMT_ba']}g}")
@@ -514,8 +675,8 @@ class FX_UI_WQ(QWidget):
                 f"<b><i>LSB</i><sub>10</sub> = </b>{LSB:.{params['FMT_ba']}g}")
         elif self.MSB_LSB_vis == 'msb':
             # Show MSB and LSB data
-            self.lbl_MSB.setVisible(True)
-            self.lbl_LSB.setVisible(True)
+            _set_visible_if(self.lbl_MSB, True)
+            _set_visible_if(self.lbl_LSB, True)
             self.lbl_MSB.setText(
                 "<b><i>&nbsp;&nbsp;MSB</i><sub>10</sub> = </b>"
                 f"{MSB:.{params['FMT_ba']}g}")
@@ -524,16 +685,7 @@ class FX_UI_WQ(QWidget):
         else:
             logger.error(f"Unknown option MSB_LSB_vis = '{self.MSB_LSB_vis}'")
 
-        self.enable_subwidgets()
 
-    # --------------------------------------------------------------------------
-    def enable_subwidgets(self):
-        """
-        Enable integer and fractional part of the quantization format, depending on 'qfrmt'
-        and 'w_a_m' settings.
-        """
-        self.ledWI.setEnabled(self.q_dict['w_a_m'] == 'm')
-        self.ledWF.setEnabled(self.q_dict['w_a_m'] == 'm')
 # ==============================================================================
 if __name__ == '__main__':
     """ Run widget standalone with `python -m pyfda.fixpoint_widgets.fx_ui_wq` """
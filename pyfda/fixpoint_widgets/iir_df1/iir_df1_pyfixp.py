@@ -11,13 +11,356 @@ Fixpoint class for calculating direct-form DF1 IIR filter using pyfixp routines
 """
 import numpy as np
 from numpy.lib.function_base import iterable
+from numpy.lib.stride_tricks import sliding_window_view
+import scipy.signal as sig
 import pyfda.filterbroker as fb
 import pyfda.libs.pyfda_fix_lib as fx
-from pyfda.libs.pyfda_fix_lib import quant_coeffs
+# `njit` is a dummy decorator when numba is not installed (`NUMBA == False`)
+from pyfda.libs.pyfda_fix_lib import quant_coeffs, NUMBA, njit
 
 import logging
 logger = logging.getLogger(__name__)
 
+# Integer codes for quantization and overflow modes supported by the numba kernel
+QUANT_CODES = {'round': 0, 'rint': 0, 'fix': 1, 'floor': 2, 'ceil': 3, 'none': 4}
+OVFL_CODES = {'wrap': 0, 'sat': 1, 'none': 2}
+
+# Column indices of packed quantizer parameters (see `_pack_q()`)
+_SCALE, _SCALE_WF, _QUANT, _OVFL, _MIN, _MAX, _MSB = range(7)
+# Column indices of packed integer quantizer parameters (see `_pack_q_int()`)
+_I_WF, _I_QUANT, _I_OVFL, _I_MSB = range(4)
+
+LUT_W_MAX = 16  # max. word length for requantization via lookup table (64k entries)
+TILE_N = 4096  # number of stimuli processed per call of the numba kernels
+
+
+# ------------------------------------------------------------------------------
+def _pack_q(Q: fx.Fixed) -> np.ndarray:
+    """
+    Return the parameters of the quantizer object `Q` needed by the numba kernel
+    as a contiguous float array `[scale, 2 ** WF, quant code, ovfl code, MIN, MAX, MSB]`
+    (indexed by `_SCALE`, `_SCALE_WF`, ...) or `None` when the quantization or
+    overflow mode is not supported by the kernel.
+    """
+    if Q.q_dict['quant'] not in QUANT_CODES or Q.q_dict['ovfl'] not in OVFL_CODES:
+        return None
+    # scaling of `Fixed.fixp()` with the default setting `scaling='mult'`
+    scale_WF = float(1 << Q.q_dict['WF'])  # WF >= 0, see `Fixed.set_qdict()`
+    scale = scale_WF if fb.fil[0]['qfrmt'] == 'qint' else 1.
+    return np.array([scale, scale_WF, QUANT_CODES[Q.q_dict['quant']],
+                     OVFL_CODES[Q.q_dict['ovfl']], Q.MIN, Q.MAX, Q.MSB], dtype=np.float64)
+
+
+# ------------------------------------------------------------------------------
+def _pack_q_int(Q: fx.Fixed) -> list:
+    """
+    Return the parameters of the quantizer object `Q` for the integer numba kernel
+    as a list `[WF, quant code, ovfl code, MSB / LSB]` (indexed by `_I_WF`, ...)
+    or `None` when the settings are not supported by the integer kernel: Only
+    'qfrac' format and quantizing modes are supported, the word length must
+    be at least one bit.
+    """
+    if fb.fil[0]['qfrmt'] != 'qfrac' or Q.q_dict['ovfl'] not in OVFL_CODES\
+            or Q.q_dict['quant'] not in QUANT_CODES or Q.q_dict['quant'] == 'none'\
+            or Q.q_dict['WI'] + Q.q_dict['WF'] < 1:
+        return None
+    return [Q.q_dict['WF'], QUANT_CODES[Q.q_dict['quant']], OVFL_CODES[Q.q_dict['ovfl']],
+            1 << (Q.q_dict['WI'] + Q.q_dict['WF'] - 1)]
+
+
+# ------------------------------------------------------------------------------
+def _q_mul_dict(p: dict) -> dict:
+    """
+    Return the quantizer dict for the partial products, derived from the
+    accumulator settings `p['QACC']` with the word format for the sum of
+    partial products b_i * x_i.
+    """
+    q_mul = p['QACC'].copy()
+    DW = int(np.ceil(np.log2(len(p['QCB']))))  # word growth
+    q_mul.update({'WI': p['QI']['WI'] + p['QCB']['WI'] + DW,
+                  'WF': p['QI']['WF'] + p['QCB']['WF']})
+    return q_mul
+
+
+# ------------------------------------------------------------------------------
+def _on_grid(v, WF: int) -> bool:
+    """ Return `True` when all values of `v` are integer multiples of 2 ** -WF """
+    v = np.asarray(v, dtype=np.float64) * 2. ** WF
+    return np.array_equal(v, np.floor(v))
+
+
+# ------------------------------------------------------------------------------
+def _to_int(v, WF: int) -> np.ndarray:
+    """ Convert the values `v` on the grid 2 ** -WF to integers scaled by 2 ** WF """
+    return np.rint(np.asarray(v, dtype=np.float64) * 2. ** WF).astype(np.int64)
+
+
+# ------------------------------------------------------------------------------
+def _update_ovfl_cnt(Q: fx.Fixed, N: int, N_pos: int, N_neg: int) -> None:
+    """
+    Update the counters of quantizer object `Q` with the number of quantized
+    values `N` and the number of positive / negative overflows calculated by
+    the numba kernel, the same way as `Q.fixp()` would have done.
+    """
+    Q.N += N
+    if Q.q_dict['ovfl'] == 'none':
+        Q.N_over_neg = Q.N_over_pos = Q.N_over = 0
+    else:
+        Q.N_over_pos += N_pos
+        Q.N_over_neg += N_neg
+        Q.N_over = Q.N_over_neg + Q.N_over_pos
+    Q.q_dict.update({'N_over': Q.N_over})
+
+
+# ------------------------------------------------------------------------------
+def _fixp_lut(Q_in: fx.Fixed, Q: fx.Fixed) -> tuple:
+    """
+    Return a lookup table `(yq, ovr_flag)` with the results and overflow flags of
+    `Q.fixp()` for all values on the grid of quantizer `Q_in` in 'qfrac' format,
+    indexed by `value / Q_in.LSB - Q_in.MIN / Q_in.LSB`. Return `None` when the
+    values of `Q_in` are not bounded by `W <= LUT_W_MAX` bits or when the quantizer
+    `Q` has a memory ('dsm').
+    """
+    W = Q_in.q_dict['WI'] + Q_in.q_dict['WF'] + 1
+    if fb.fil[0]['qfrmt'] != 'qfrac' or W > LUT_W_MAX\
+            or Q_in.q_dict['quant'] in {'none', 'dsm'} or Q_in.q_dict['ovfl'] == 'none'\
+            or Q.q_dict['quant'] == 'dsm':
+        return None
+    Q_lut = fx.Fixed(Q.q_dict.copy())  # leave the overflow counters of Q untouched
+    yq = Q_lut.fixp(np.arange(-(1 << (W - 1)), 1 << (W - 1)) * Q_in.LSB)
+    return yq, Q_lut.ovr_flag
+
+
+# ------------------------------------------------------------------------------
+@njit(cache=True)
+def _fixp_scalar(y, q, cnt):
+    """
+    Quantize the float `y` with the packed quantizer parameters `q` (see `_pack_q()`),
+    reproducing `Fixed.fixp()` for scalars. Overflows are counted in
+    `cnt = [N, N_pos, N_neg]`.
+    """
+    scale_WF, MIN, MAX, MSB = q[_SCALE_WF], q[_MIN], q[_MAX], q[_MSB]
+    quant, ovfl = int(q[_QUANT]), int(q[_OVFL])
+    y = y * q[_SCALE]
+    y = y * scale_WF
+    if quant == 0:
+        yq = np.round(y)
+    elif quant == 1:
+        yq = np.trunc(y)
+    elif quant == 2:
+        yq = np.floor(y)
+    elif quant == 3:
+        yq = np.ceil(y)
+    else:
+        yq = y
+    yq = yq / scale_WF
+
+    cnt[0] += 1
+    if ovfl != 2:
+        if yq > MAX:
+            cnt[1] += 1
+            if ovfl == 1:
+                yq = MAX
+            else:
+                yq = yq - 4. * MSB * np.trunc((np.sign(yq) * 2 * MSB + yq) / (4 * MSB))
+        elif yq < MIN:
+            cnt[2] += 1
+            if ovfl == 1:
+                yq = MIN
+            else:
+                yq = yq - 4. * MSB * np.trunc((np.sign(yq) * 2 * MSB + yq) / (4 * MSB))
+    return yq
+
+
+# ------------------------------------------------------------------------------
+@njit(cache=True)
+def _fixp_int(v, WF_in, q, cnt):
+    """
+    Requantize the integer `v` with `WF_in` fractional bits to an integer with
+    the fractional bits of the packed integer quantizer parameters `q` (see
+    `_pack_q_int()`). Rounding and overflow handling are the same as in
+    `Fixed.fixp()`, overflows are counted in `cnt = [N, N_pos, N_neg]`.
+    """
+    s = WF_in - q[_I_WF]
+    if s <= 0:
+        v = v << -s
+    else:
+        quant = q[_I_QUANT]
+        if quant == 2:  # floor
+            v = v >> s
+        elif quant == 3:  # ceil
+            v = -((-v) >> s)
+        elif quant == 1:  # fix
+            v = v >> s if v >= 0 else -((-v) >> s)
+        else:  # round, half to even like np.round()
+            vq = v >> s
+            r = v - (vq << s)
+            half = 1 << (s - 1)
+            if r > half or (r == half and vq & 1):
+                vq += 1
+            v = vq
+
+    cnt[0] += 1
+    ovfl = q[_I_OVFL]
+    if ovfl != 2:
+        MSB = q[_I_MSB]
+        if v > 2 * MSB - 1:
+            cnt[1] += 1
+        elif v < -2 * MSB:
+            cnt[2] += 1
+        else:
+            return v
+        if ovfl == 1:
+            v = min(max(v, -2 * MSB), 2 * MSB - 1)
+        else:
+            # two's complement wrap-around by masking the word length (4 MSB is a
+            # power of two). `Fixed.fixp()` calculates v - 4 MSB * fix((sign(v) * 2 MSB
+            # + v) / 4 MSB) which yields +2 MSB instead of -2 MSB for negative values
+            over = v > 0
+            v = ((v + 2 * MSB) & (4 * MSB - 1)) - 2 * MSB
+            if v == -2 * MSB and not over:
+                v = 2 * MSB
+    return v
+
+
+# ------------------------------------------------------------------------------
+@njit(cache=True)
+def _np_sum(a):
+    """
+    Sum up the elements of the 1D array `a` in the same order as `np.sum()`
+    (pairwise summation), yielding bit-identical results.
+    """
+    n = len(a)
+    if n < 8:
+        res = 0.
+        for i in range(n):
+            res += a[i]
+        return res
+    elif n <= 128:
+        r = a[:8].copy()
+        i = 8
+        while i < n - (n % 8):
+            for j in range(8):
+                r[j] += a[i + j]
+            i += 8
+        res = ((r[0] + r[1]) + (r[2] + r[3])) + ((r[4] + r[5]) + (r[6] + r[7]))
+        while i < n:
+            res += a[i]
+            i += 1
+        return res
+    else:
+        n2 = n // 2
+        n2 -= n2 % 8
+        return _np_sum(a[:n2]) + _np_sum(a[n2:])
+
+
+# ------------------------------------------------------------------------------
+@njit(cache=True, fastmath=False)
+def _df1_kernel(x, zi_b, zi_a, b_q, a_q, q_packed, cnt, quant_b):
+    """
+    Calculate the DF1 difference equation for the stimuli `x` sample by sample
+    (see `IIR_DF1_pyfixp.fxfilter()`) and return the accumulator values,
+    requantized to the output format.
+
+    `zi_b` and `zi_a` contain the transversal and the recursive registers, both
+    are updated in-place. The window over the transversal registers and the
+    stimuli is indexed directly, without concatenating them. The rows of `q_packed`
+    contain the packed parameters of the partial product, accumulator and output
+    quantizers, their overflows are counted in the rows of `cnt`. When `quant_b`
+    is False, the transversal partial products are known to be exact in the
+    partial product format and are accumulated without requantization.
+
+    The recursive registers are kept in a circular buffer during the calculation,
+    `zi_a[i]` corresponds to `buf_a[(head + i) % M]`.
+    """
+    q_mul, q_acc, q_o = q_packed[0], q_packed[1], q_packed[2]
+    L_b = len(b_q)
+    M = len(zi_a)  # number of recursive (and transversal) registers
+    N = len(x)  # number of stimuli
+    y_o = np.zeros(N)
+    xb_q = np.zeros(L_b)
+    xa_q = np.zeros(M + 1)  # last element remains zero
+    buf_a = zi_a.copy()
+    head = 0
+    for k in range(N):
+        for i in range(L_b):
+            j = k + i  # index in the sequence of registers followed by stimuli
+            xb = zi_b[j] if j < M else x[j - M]
+            if quant_b:
+                xb_q[i] = _fixp_scalar(xb * b_q[i], q_mul, cnt[0])
+            else:
+                xb_q[i] = xb * b_q[i]
+        if not quant_b:
+            cnt[0, 0] += L_b
+        j = head
+        for i in range(M):
+            xa_q[i] = _fixp_scalar(buf_a[j] * a_q[i + 1], q_mul, cnt[0])
+            j += 1
+            if j == M:
+                j = 0
+        y_q = _fixp_scalar(_np_sum(xb_q) - _np_sum(xa_q), q_acc, cnt[1])
+        y_o[k] = _fixp_scalar(y_q, q_o, cnt[2])
+        if M > 0:
+            # move head back by one instead of shifting the registers
+            head = head - 1 if head > 0 else M - 1
+            buf_a[head] = y_o[k]
+    for i in range(M):  # restore register order
+        zi_a[i] = buf_a[(head + i) % M]
+    for i in range(M):  # store the last M stimuli in the transversal registers
+        j = N + i
+        zi_b[i] = zi_b[j] if j < M else x[j - M]
+    return y_o
+
+
+# ------------------------------------------------------------------------------
+@njit(cache=True)
+def _df1_kernel_int(x, zi_b, zi_a, b_q, a_q, WF_x, WF_b, WF_a, q_packed, cnt):
+    """
+    Integer version of `_df1_kernel()`: All values are integers, scaled by 2 ** WF
+    of their quantizers (stimuli and transversal registers with `WF_x`,
+    coefficients with `WF_b` and `WF_a`, recursive registers with the WF of the
+    output quantizer). The transversal partial products must be exact in the
+    partial product format (see `IIR_DF1_pyfixp.exact_b_products()`).
+
+    Return the accumulator values requantized to the output format, scaled by
+    2 ** WF of the output quantizer.
+    """
+    q_mul, q_acc, q_o = q_packed[0], q_packed[1], q_packed[2]
+    WF_mul, WF_acc = q_mul[_I_WF], q_acc[_I_WF]
+    s_b = WF_mul - WF_x - WF_b  # left shift of transversal products, >= 0
+    WF_xa = q_o[_I_WF] + WF_a  # fractional bits of recursive products
+    L_b = len(b_q)
+    M = len(zi_a)
+    N = len(x)
+    y_o = np.zeros(N, dtype=np.int64)
+    buf_a = zi_a.copy()
+    head = 0
+    for k in range(N):
+        acc_b = 0
+        for i in range(L_b):
+            j = k + i
+            xb = zi_b[j] if j < M else x[j - M]
+            acc_b += (xb * b_q[i]) << s_b
+        cnt[0, 0] += L_b
+        acc_a = 0
+        j = head
+        for i in range(M):
+            acc_a += _fixp_int(buf_a[j] * a_q[i + 1], WF_xa, q_mul, cnt[0])
+            j += 1
+            if j == M:
+                j = 0
+        y_q = _fixp_int(acc_b - acc_a, WF_mul, q_acc, cnt[1])
+        y_o[k] = _fixp_int(y_q, WF_acc, q_o, cnt[2])
+        if M > 0:
+            head = head - 1 if head > 0 else M - 1
+            buf_a[head] = y_o[k]
+    for i in range(M):
+        zi_a[i] = buf_a[(head + i) % M]
+    for i in range(M):
+        j = N + i
+        zi_b[i] = zi_b[j] if j < M else x[j - M]
+    return y_o
+
 
 # =============================================================================
 class IIR_DF1_pyfixp(object):
@@ -49,10 +392,11 @@ class IIR_DF1_pyfixp(object):
         # create various quantizers and initialize / reset them
         self.Q_b = fx.Fixed(self.p['QCB'])  # transversal coeffs.
         self.Q_a = fx.Fixed(self.p['QCA'])  # recursive coeffs
-        self.Q_mul = fx.Fixed(self.p['QACC'].copy())  # partial products
+        self.Q_mul = fx.Fixed(_q_mul_dict(self.p))  # partial products
         self.Q_acc = fx.Fixed(self.p['QACC'])  # accumulator
         self.Q_O = fx.Fixed(self.p['QO'])  # output
 
+        self.coef_cache = None  # (key, b_q, a_q, coefficient overflow counters)
         self.init(p)
 
     # ---------------------------------------------------------
@@ -88,27 +432,43 @@ class IIR_DF1_pyfixp(object):
         """
         self.p = p  # update parameter dictionary with coefficients etc.
 
-        q_mul = p['QACC'].copy()  # quantizer dict for partial products
-        DW = int(np.ceil(np.log2(len(self.p['QCB']))))  # word growth
-        # word format for sum of partial products b_i * x_i
-        q_mul.update(
-            {'WI': self.p['QI']['WI'] + self.p['QCB']['WI'] + DW,
-             'WF': self.p['QI']['WF'] + self.p['QCB']['WF']})
-        WP = q_mul['WI'] + q_mul['WF'] + 1
-
         # update the quantizers
         self.Q_b.set_qdict(self.p['QCB'])  # transversal coeffs.
         self.Q_a.set_qdict(self.p['QCA'])  # recursive coeffs
-        self.Q_mul.set_qdict(q_mul)  # partial products
+        self.Q_mul.set_qdict(_q_mul_dict(self.p))  # partial products
         self.Q_acc.set_qdict(self.p['QACC'])  # accumulator
         self.Q_O.set_qdict(self.p['QO'])  # output
-
-        # Quantize coefficients and store them in local attributes
-        # This also resets the overflow counters.
-        self.a_q = quant_coeffs(fb.fil[0]['ba'][1], self.Q_a, recursive=True)
-        self.b_q = quant_coeffs(fb.fil[0]['ba'][0], self.Q_b)
+        # lookup table for requantizing accumulator values to the output format
+        self.lut_O = _fixp_lut(self.Q_acc, self.Q_O)
+
+        # Quantize coefficients and store them in local attributes, this also resets
+        # the overflow counters. Reuse the results of the last run when neither
+        # coefficients nor coefficient quantizers have changed.
+        coef_key = (fb.fil[0]['qfrmt'],
+                    tuple(fb.fil[0]['ba'][0]), tuple(fb.fil[0]['ba'][1]),
+                    *[(Q.q_dict['WI'], Q.q_dict['WF'], Q.q_dict['quant'], Q.q_dict['ovfl'])
+                      for Q in (self.Q_b, self.Q_a)])
+        if self.coef_cache is not None and self.coef_cache[0] == coef_key:
+            _, self.b_q, self.a_q, N_over = self.coef_cache
+            for Q, (N, N_over_pos, N_over_neg) in zip((self.Q_b, self.Q_a), N_over):
+                Q.N, Q.N_over_pos, Q.N_over_neg = N, N_over_pos, N_over_neg
+                Q.N_over = N_over_pos + N_over_neg
+                Q.q_dict.update({'N_over': Q.N_over})
+        else:
+            self.a_q = quant_coeffs(fb.fil[0]['ba'][1], self.Q_a, recursive=True)
+            self.b_q = quant_coeffs(fb.fil[0]['ba'][0], self.Q_b)
+            self.coef_cache = (coef_key, self.b_q, self.a_q,
+                               [(Q.N, Q.N_over_pos, Q.N_over_neg)
+                                for Q in (self.Q_b, self.Q_a)])
 
         self.L = max(len(self.b_q), len(self.a_q))  # filter length = number of taps
+        # coefficients as contiguous float arrays and their lengths for the sample loops
+        self.b_arr = np.asarray(self.b_q, dtype=np.float64)
+        self.a_arr = np.asarray(self.a_q, dtype=np.float64)
+        self.a_tail = np.ascontiguousarray(self.a_arr[1:])  # a[0] is not used
+        self.L_b = len(self.b_q)
+        self.L_a = len(self.a_q)
+        self.pack_q()  # pack quantizer parameters for the numba kernels
 
         self.reset() # reset overflow counters (except coeffs) and registers
 
@@ -129,6 +489,72 @@ class IIR_DF1_pyfixp(object):
                 logger.warning(f"length of zi_a is {len(zi_a)} != {len(self.L)-1}")
                 self.zi_a = np.zeros(self.L - 1)
 
+    # ---------------------------------------------------------
+    def pack_q(self) -> None:
+        """
+        Pack the parameters of the partial product, accumulator and output
+        quantizers into the rows of the array `self.q_packed` for the numba kernel
+        (`None` when the kernel cannot be used). The parameters for the integer
+        kernel are stored in `self.q_packed_int` when it can be used. As the
+        parameters depend on the number format, this is stored in
+        `self.q_packed_frmt`.
+        """
+        self.q_packed_frmt = fb.fil[0]['qfrmt']
+        q_packed = [_pack_q(Q) for Q in (self.Q_mul, self.Q_acc, self.Q_O)]
+        if NUMBA and all(q is not None for q in q_packed):
+            self.q_packed = np.vstack(q_packed)
+        else:
+            self.q_packed = None
+
+        q_packed = [_pack_q_int(Q) for Q in (self.Q_mul, self.Q_acc, self.Q_O)]
+        # The sums of partial products and the products of recursive registers
+        # and coefficients need to be exact in float64 for identical results,
+        # the accumulator and the output need to be bounded
+        W_mul = self.Q_mul.q_dict['WI'] + self.Q_mul.q_dict['WF'] + 1
+        W_ya = self.Q_O.q_dict['WI'] + self.Q_O.q_dict['WF']\
+            + self.Q_a.q_dict['WI'] + self.Q_a.q_dict['WF'] + 2
+        if self.q_packed is not None and all(q is not None for q in q_packed)\
+                and W_mul + int(np.ceil(np.log2(2 * self.L))) <= 52 and W_ya <= 52\
+                and 'none' not in {self.Q_acc.q_dict['ovfl'], self.Q_O.q_dict['ovfl']}:
+            self.q_packed_int = np.array(q_packed, dtype=np.int64)
+        else:
+            self.q_packed_int = None
+
+    # ---------------------------------------------------------
+    def update_kernel_cnt(self, cnt: np.ndarray) -> None:
+        """
+        Update the overflow counters of the partial product, accumulator and
+        output quantizers with the counts `cnt` returned by the numba kernels.
+        The output requantization of the kernels replaces both the quantization
+        of the fed back output (only with recursive registers) and the final
+        quantization of the output, so it is counted twice in this case.
+        """
+        _update_ovfl_cnt(self.Q_mul, *cnt[0])
+        _update_ovfl_cnt(self.Q_acc, *cnt[1])
+        for _ in range(2 if self.L > 1 else 1):
+            _update_ovfl_cnt(self.Q_O, *cnt[2])
+
+    # ---------------------------------------------------------
+    def exact_b_products(self, x: np.ndarray) -> bool:
+        """
+        Return `True` when quantizing the partial products of the transversal
+        registers and the stimuli `x` with the coefficients `self.b_q` has no
+        effect, i.e. all values are on the grid of their quantizers ('qfrac'
+        format) and the products fit into the range and the word length of `Q_mul`.
+        In this case, the partial products can be accumulated directly.
+        """
+        WF_x = self.p['QI']['WF']
+        if fb.fil[0]['qfrmt'] != 'qfrac' or self.Q_mul.q_dict['quant'] == 'dsm'\
+                or self.Q_mul.q_dict['WI'] + self.Q_mul.q_dict['WF'] > 52\
+                or self.Q_mul.q_dict['WF'] < WF_x + self.Q_b.q_dict['WF']\
+                or len(x) == 0:
+            return False
+        if not (_on_grid(x, WF_x) and _on_grid(self.zi_b, WF_x)
+                and _on_grid(self.b_arr, self.Q_b.q_dict['WF'])):
+            return False
+        x_max = max(np.max(np.abs(x)), np.max(np.abs(self.zi_b), initial=0.))
+        return bool(x_max * np.max(np.abs(self.b_arr)) <= self.Q_mul.MAX)
+
     # ---------------------------------------------------------
     def reset(self):
         """
@@ -141,6 +567,31 @@ class IIR_DF1_pyfixp(object):
         self.N_over_filt = 0
         self.zi_a = np.zeros(self.L - 1)
         self.zi_b = np.zeros(self.L - 1)
+        # buffer for transversal registers followed by the stimuli of one block,
+        # grown on demand by `fill_ring()`
+        self._ring = np.zeros(2 * (self.L - 1) + 1)
+        # buffers for accumulator values and partial products of the NumPy sample
+        # loop, reused in successive calls of `fxfilter()`. A zero is appended
+        # to xa_q to equalize the lengths of xb_q and xa_q
+        self._y_q = np.zeros(0)
+        self._xb_q = np.empty(self.L_b)
+        self._xa_q = np.zeros(self.L)
+
+    # ---------------------------------------------------------
+    def fill_ring(self, x: np.ndarray) -> np.ndarray:
+        """
+        Copy the transversal registers `self.zi_b` and the stimuli `x` into the
+        preallocated buffer `self._ring` and return a view of the `L - 1 + len(x)`
+        valid elements. The buffer is only reallocated when `x` is longer than
+        all previous blocks, avoiding a new concatenated array per call.
+        """
+        M = self.L - 1
+        N = len(x)
+        if len(self._ring) < M + N:
+            self._ring = np.zeros(2 * M + N)
+        self._ring[:M] = self.zi_b
+        self._ring[M:M + N] = x
+        return self._ring[:M + N]
 
     # ---------------------------------------------------------
     def fxfilter(self, x: iterable = None,
@@ -192,60 +643,162 @@ class IIR_DF1_pyfixp(object):
                 self.zi_a = zi_a[:self.L - 1]
                 logger.warning("len(zi_a) > len(coeff) - 1, zi_a was truncated")
 
-        # initialize quantized partial products and output arrays
-        y_q = xb_q = np.zeros(len(x))
-        xa_q = np.zeros(self.L - 1)
-
         # Calculate response by:
         # - feed last output `y_q[k]`` into the recursive register `self.zi_a`
         # - append new stimuli `x` to transversal register state `self.zi_b`
+        #   (the numba kernel indexes registers and stimuli without concatenating)
         # - slide a window with length `len(b)` over `self.zi`, starting at position `k`
         #   and multiply it with the coefficients `b`, yielding the partial products x*b
         #   TODO: Doing this for the last len(x) terms should be enough
         # - quantize the partial products x*b and x*a, yielding xb_q and x_aq
         # - accumulate the quantized partial products and quantize result, yielding y_q[k]
 
-        self.zi_b = np.concatenate((self.zi_b, x))
-
-        logger.warning(f"a_q = \n{self.a_q}\n")
-
-        for k in range(len(x)):
-            # partial products xa_q and xb_q at time k, quantized with Q_mul:
-            if fb.fil[0]['qfrmt'] == 'qint':
-                xb_q = self.Q_mul.fixp(self.zi_b[k:k + len(self.b_q)] * self.b_q)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"a_q = \n{self.a_q}\n")
+
+        if self.q_packed_frmt != fb.fil[0]['qfrmt']:
+            self.pack_q()
+        quant_b = not self.exact_b_products(x)  # requantize transversal products?
+        y_o = None  # output, when already requantized by the numba kernels
+        qfrmt = fb.fil[0]['qfrmt']
+        if qfrmt != 'qint' and self.L_a == self.L and all(
+                Q.q_dict['quant'] == 'none' and Q.q_dict['ovfl'] == 'none'
+                for Q in (self.Q_mul, self.Q_acc, self.Q_O)):
+            # Neither partial products, accumulator nor the fed back output are
+            # quantized or saturated (and not rescaled as for 'qint'): calculate
+            # the response in one go with `lfilter`.
+            # The window over the transversal registers multiplies the oldest
+            # sample with b[0], a[0] is not used by the difference equation.
+            b = np.concatenate((np.zeros(self.L - self.L_b), self.b_arr[::-1]))
+            a = np.concatenate(([1.], self.a_tail))
+            zi = sig.lfiltic(b, a, y=self.zi_a, x=self.zi_b[::-1])
+            y_q = sig.lfilter(b, a, x, zi=zi)[0]
+            self.zi_a = np.concatenate((y_q[::-1], self.zi_a))[:self.L - 1]
+            self.zi_b = np.concatenate((self.zi_b, x))[-(self.L-1):]
+            # number of quantizations in the sample loop, no overflows are counted
+            _update_ovfl_cnt(self.Q_mul, len(x) * (self.L - 1 + self.L_b), 0, 0)
+            _update_ovfl_cnt(self.Q_acc, len(x), 0, 0)
+            if self.L > 1:  # fed back output
+                _update_ovfl_cnt(self.Q_O, len(x), 0, 0)
+        elif self.q_packed_int is not None and not quant_b and self.L_a == self.L\
+                and _on_grid(self.a_arr, self.Q_a.q_dict['WF'])\
+                and _on_grid(self.zi_a, self.Q_O.q_dict['WF']):
+            # All values are on the grids of their quantizers: run the sample loop
+            # as numba kernel with integer arithmetics, values are scaled by 2 ** WF
+            cnt = np.zeros((3, 3), dtype=np.int64)  # [N, N_pos, N_neg] per quantizer
+            WF_x, WF_b, WF_a, WF_O = self.p['QI']['WF'], self.Q_b.q_dict['WF'],\
+                self.Q_a.q_dict['WF'], self.Q_O.q_dict['WF']
+            zi_b = _to_int(self.zi_b, WF_x)
+            zi_a = _to_int(self.zi_a, WF_O)
+            x_i = _to_int(x, WF_x)
+            b_i, a_i = _to_int(self.b_arr, WF_b), _to_int(self.a_arr, WF_a)
+            y_o = np.empty(len(x), dtype=np.int64)
+            # process the stimuli in tiles, registers are carried over in-place
+            for n in range(0, len(x), TILE_N):
+                y_o[n:n + TILE_N] = _df1_kernel_int(
+                    x_i[n:n + TILE_N], zi_b, zi_a, b_i, a_i,
+                    WF_x, WF_b, WF_a, self.q_packed_int, cnt)
+            y_o = y_o * 2. ** -WF_O
+            self.zi_b = zi_b * 2. ** -WF_x
+            self.zi_a = zi_a * 2. ** -WF_O
+            self.update_kernel_cnt(cnt)
+        elif self.q_packed is not None and self.L_a == self.L:
+            # run the sample loop as compiled numba kernel, registers are updated
+            # in-place (on copies, not on arrays passed by the caller)
+            cnt = np.zeros((3, 3), dtype=np.int64)  # [N, N_pos, N_neg] per quantizer
+            self.zi_a = np.array(self.zi_a, dtype=np.float64)
+            self.zi_b = np.array(self.zi_b, dtype=np.float64)
+            x_f = np.asarray(x, dtype=np.float64)
+            y_o = np.empty(len(x))
+            # process the stimuli in tiles, registers are carried over in-place
+            for n in range(0, len(x), TILE_N):
+                y_o[n:n + TILE_N] = _df1_kernel(
+                    x_f[n:n + TILE_N], self.zi_b, self.zi_a,
+                    self.b_arr, self.a_arr, self.q_packed, cnt, quant_b)
+            self.update_kernel_cnt(cnt)
+        else:
+            ring = self.fill_ring(x)  # transversal registers followed by stimuli
+            # requantize accumulator to output format via lookup table if possible
+            lut_O = self.lut_O if qfrmt == 'qfrac' else None
+            cnt_O = np.zeros(3, dtype=np.int64)  # [N, N_pos, N_neg] for lut_O
+            b, a_tail, L_b = self.b_arr, self.a_tail, self.L_b
+            # buffers for accumulator values and partial products
+            if len(self._y_q) < len(x):
+                self._y_q = np.empty(len(x))
+            y_q = self._y_q[:len(x)]
+            xb_q, xa_q = self._xb_q, self._xa_q
+            # Recursive registers are kept twice in a row in buf_a, the registers
+            # in their usual order are the view buf_a[head:head + M]. Moving the
+            # head back by one and writing two elements replaces shifting all
+            # registers for each sample.
+            M = self.L - 1
+            buf_a = np.concatenate((self.zi_a, self.zi_a))
+            head = 0
+            # When the transversal partial products are exact and their sums fit
+            # into the float64 mantissa, the sums don't depend on the order of
+            # summation: calculate them for all samples at once with a dot product
+            W_mul = self.Q_mul.q_dict['WI'] + self.Q_mul.q_dict['WF'] + 1
+            if not quant_b and W_mul + int(np.ceil(np.log2(L_b))) <= 53:
+                sum_b = sliding_window_view(ring, L_b)[:len(x)] @ b
+                self.Q_mul.N += L_b * len(x)
             else:
-                xb_q = self.Q_mul.fixp(self.zi_b[k:k + len(self.b_q)] * self.b_q)
-            # logger.warning(f"xb_q = \n{xb_q}\n")
-            # append a zero to xa_q to equalize length of xb_q and xa_q
-            xa_q = np.append(self.Q_mul.fixp(self.zi_a * self.a_q[1:]), 0)
-            logger.warning(f"zi_a = \n{self.zi_a}")
-            logger.warning(f"xa_q = \n{xa_q}")
-
-            # accumulate partial products x_bq and x_aq and quantize them (Q_acc)
-            # quantize individual accumulation steps - needed?!
-            # y_q[k] = 0.0
-            # for i in range(len(self.b_q)):
-            #     y_q[k] += self.Q_acc.fixp(xb_q[i] - xa_q[i])
-
-            y_q[k] = self.Q_acc.fixp(np.sum(xb_q) - np.sum(xa_q))
-            self.zi_a[1:] = self.zi_a[:-1]  # shift right by one
-
-            # and insert last output value quantized to output format
-            self.zi_a[0] = self.Q_O.fixp(y_q[k])
-
-            # logger.warning(f"zi_a = {self.zi_a}\n"
-            #                f"zi_b = {self.zi_b}")
-
-        self.zi_b = self.zi_b[-(self.L-1):]  # store last L-1 inputs (i.e. the L-1 registers)
+                sum_b = None
+            for k in range(len(x)):
+                # partial products xa_q and xb_q at time k, quantized with Q_mul:
+                if sum_b is None:
+                    np.multiply(ring[k:k + L_b], b, out=xb_q)
+                    if quant_b:
+                        xb_q[:] = self.Q_mul.fixp(xb_q)
+                    else:
+                        self.Q_mul.N += L_b
+                    sum_b_k = np.sum(xb_q)
+                else:
+                    sum_b_k = sum_b[k]
+                np.multiply(buf_a[head:head + M], a_tail, out=xa_q[:-1])
+                xa_q[:-1] = self.Q_mul.fixp(xa_q[:-1])
+
+                # accumulate partial products x_bq and x_aq and quantize them (Q_acc)
+                # quantize individual accumulation steps - needed?!
+                # y_q[k] = 0.0
+                # for i in range(len(self.b_q)):
+                #     y_q[k] += self.Q_acc.fixp(xb_q[i] - xa_q[i])
+
+                y_q[k] = self.Q_acc.fixp(sum_b_k - np.sum(xa_q))
+
+                # insert last output value quantized to output format, there is
+                # nothing to feed back without recursive registers (M == 0)
+                if M == 0:
+                    continue
+                if lut_O is None:
+                    y_fb = self.Q_O.fixp(y_q[k])
+                else:
+                    idx = int(round((y_q[k] - self.Q_acc.MIN) / self.Q_acc.LSB))
+                    y_fb = lut_O[0][idx]
+                    cnt_O[0] += 1
+                    if lut_O[1][idx] > 0:
+                        cnt_O[1] += 1
+                    elif lut_O[1][idx] < 0:
+                        cnt_O[2] += 1
+                head = head - 1 if head > 0 else M - 1  # instead of shift right
+                buf_a[head] = buf_a[head + M] = y_fb
+            if lut_O is not None:
+                _update_ovfl_cnt(self.Q_O, *cnt_O)
+            self.zi_a = buf_a[head:head + M].copy()
+
+            # store last L-1 inputs (i.e. the L-1 registers), copied from the buffer
+            self.zi_b = ring[len(x):].copy()
 
         # Overflows in Q_mul are added to overflows in Q_Acc, then Q_mul is reset
-        if self.Q_acc.N_over > 0 or self.Q_mul.N_over > 0:
+        if (self.Q_acc.N_over > 0 or self.Q_mul.N_over > 0)\
+                and logger.isEnabledFor(logging.WARNING):
             logger.warning(f"Overflows: N_Acc = {self.Q_acc.N_over}, "
                            f"N_Mul = {self.Q_mul.N_over}")
         self.Q_acc.N_over += self.Q_mul.N_over
         self.Q_mul.resetN()
 
-        return self.Q_O.fixp(y_q[:len(x)]), self.zi_b, self.zi_a
+        if y_o is None:
+            y_o = self.Q_O.fixp(y_q[:len(x)])
+        return y_o, self.zi_b, self.zi_a
 
 
 # ------------------------------------------------------------------------------
@@ -63,6 +63,7 @@ class Input_Specs(QWidget):
             ("9", "Mem 9", "Save / load to / from memory 9")
         ]
         self.cmb_filter_selection_default = "file"
+        self._id = id(self)  # for detecting signals emitted by this instance
 
         self._construct_UI()
 
@@ -83,8 +84,9 @@ class Input_Specs(QWidget):
         its parent widget (`input_specs`) to prevent infinite loops.
 
         """
-        logger.debug(f"SIG_RX: {pprint_log(dict_sig)}")
-        if dict_sig['id'] == id(self):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"SIG_RX: {pprint_log(dict_sig)}")
+        if dict_sig.get('id') == self._id:
             # logger.warning(f"Stopped infinite loop:\n\tPropagate = {propagate}\
             #               \n{pprint_log(dict_sig)}")
             return
@@ -120,6 +122,7 @@ class Input_Specs(QWidget):
         """
         Construct User Interface from all input subwidgets
         """
+        margins = params['wdg_margins']
         self.butLoadFilt = QPushButton("LOAD FILTER", self)
         self.butLoadFilt.setToolTip("Load filter from disk or memory")
         self.cmb_filter_selection = QComboBox(self)
@@ -145,7 +148,7 @@ class Input_Specs(QWidget):
         lay_v_buttons_load_save.addLayout(lay_h_buttons_load_save_2)
         self.frm_buttons_load_save = QFrame()
         self.frm_buttons_load_save.setLayout(lay_v_buttons_load_save)
-        self.frm_buttons_load_save.setContentsMargins(*params['wdg_margins'])
+        self.frm_buttons_load_save.setContentsMargins(*margins)
 
         self.butDesignFilt = QPushButton("DESIGN FILTER", self)
         self.butDesignFilt.setToolTip("Design filter with chosen specs")
@@ -154,7 +157,7 @@ class Input_Specs(QWidget):
         layHButtons2 = QHBoxLayout()
         layHButtons2.addWidget(self.butDesignFilt)  # <Design Filter> button
         layHButtons2.addWidget(self.butQuit)        # <Quit> button
-        layHButtons2.setContentsMargins(*params['wdg_margins'])
+        layHButtons2.setContentsMargins(*margins)
 
         # Subwidget for selecting filter with response type rt (LP, ...),
         #    filter type ft (IIR, ...) and filter class fc (cheby1, ...)
@@ -199,7 +202,7 @@ class Input_Specs(QWidget):
         self.frmMsg.setLayout(layVMsg)
         layVFrm = QVBoxLayout()
         layVFrm.addWidget(self.frmMsg)
-        layVFrm.setContentsMargins(*params['wdg_margins'])
+        layVFrm.setContentsMargins(*margins)
 
         # ----------------------------------------------------------------------
         # LAYOUT for input specifications and buttons
@@ -218,7 +221,7 @@ class Input_Specs(QWidget):
 
         layVMain.addStretch()
 
-        layVMain.setContentsMargins(*params['wdg_margins'])
+        layVMain.setContentsMargins(*margins)
 
         self.setLayout(layVMain)  # main layout of widget
 
@@ -15,7 +15,7 @@ from .pyfda_qt_lib import (qget_cmb_box, qset_cmb_box, qcmb_box_populate,
                            qwindow_stay_on_top)
 from pyfda.pyfda_rc import params
 from .compat import (QLabel, QComboBox, QDialog, QPushButton, QRadioButton,
-                     QCheckBox, QVBoxLayout, QGridLayout, pyqtSignal)
+                     QCheckBox, QVBoxLayout, QGridLayout, QTimer, pyqtSignal)
 
 import logging
 logger = logging.getLogger(__name__)
@@ -160,6 +160,13 @@ class CSV_option_box(QDialog):
         self.load_settings()
 
         # ============== Signals & Slots ================================
+        # Changes are stored immediately but signalled only once per event loop
+        # iteration by a zero-delay timer, e.g. when a click changes two widgets
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self._emit_settings)
+
         butClose.clicked.connect(self.close)
         self.cmb_orientation.currentIndexChanged.connect(self.store_settings)
         self.cmb_delimiter.currentIndexChanged.connect(self.store_settings)
@@ -183,11 +190,17 @@ class CSV_option_box(QDialog):
             params['CSV']['cmsis'] = self.chk_cmsis.isChecked()
             params['CSV']['clipboard'] = self.radClipboard.isChecked()
 
-            self.emit({'ui_global_changed': 'csv'})
+            self._emit_timer.start()  # emit 'ui_global_changed' once
 
         except KeyError as e:
             logger.error(e)
 
+    def _emit_settings(self):
+        """
+        Signal changed CSV settings, called by `self._emit_timer`.
+        """
+        self.emit({'ui_global_changed': 'csv'})
+
     def load_settings(self):
         """
         Load settings of CSV options widget from ``pyfda_rc.params``.
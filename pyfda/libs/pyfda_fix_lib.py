@@ -12,6 +12,8 @@ numpy values and formatting reals in various formats
 """
 # ===========================================================================
 import re
+import math
+import numbers
 import inspect
 import copy
 
@@ -26,6 +28,16 @@ try:
 except ImportError:
     DS = False
 
+try:
+    from numba import njit
+    NUMBA = True
+except ImportError:
+    NUMBA = False
+
+    def njit(*args, **kwargs):
+        """ Dummy decorator when numba is not installed, kernels are not used then """
+        return lambda func: func
+
 import logging
 logger = logging.getLogger(__name__)
 
@@ -48,38 +60,13 @@ def bin2hex(bin_str, WI=0):
     and after the radix point (position given by `WI`) is a multiple of 4.
     """
 
-    wmap = {
-        '0000': '0',
-        '0001': '1',
-        '0010': '2',
-        '0011': '3',
-        '0100': '4',
-        '0101': '5',
-        '0110': '6',
-        '0111': '7',
-        '1000': '8',
-        '1001': '9',
-        '1010': 'A',
-        '1011': 'B',
-        '1100': 'C',
-        '1101': 'D',
-        '1110': 'E',
-        '1111': 'F'
-        }
-
-    hex_str = ""
-
     if WI > 0:
         # slice string with integer bits and prepend with zeros to obtain a
-        # multiple of 4 length:
+        # multiple of 4 length, then convert all chunks of 4 bits at once:
         bin_i_str = bin_str[:WI+1]
-        while (len(bin_i_str) % 4 != 0):
-            bin_i_str = "0" + bin_i_str
-
-        i = 0
-        while (i < len(bin_i_str)):  # map chunks of 4 binary bits to one hex digit
-            hex_str = hex_str + wmap[bin_i_str[i:i + 4]]
-            i = i + 4
+        bin_i_str = bin_i_str.rjust(-(-len(bin_i_str) // 4) * 4, '0')
+        hex_str = format(int(bin_i_str, 2), 'X').zfill(len(bin_i_str) // 4)\
+            if bin_i_str else ""
     else:
         hex_str = bin_str[0]  # copy MSB as sign bit
 
@@ -87,16 +74,9 @@ def bin2hex(bin_str, WI=0):
     # slice string with fractional bits and append with zeros to obtain a
     # multiple of 4 length:
     if WF > 0:
-        hex_str = hex_str + '.'
         bin_f_str = bin_str[WI+1:]
-
-        while (len(bin_f_str) % 4 != 0):
-            bin_f_str = bin_f_str + "0"
-
-        i = 0
-        while (i < len(bin_f_str)):  # map chunks of 4 binary bits to one hex digit
-            hex_str = hex_str + wmap[bin_f_str[i:i + 4]]
-            i = i + 4
+        bin_f_str = bin_f_str.ljust(-(-len(bin_f_str) // 4) * 4, '0')
+        hex_str = hex_str + '.' + format(int(bin_f_str, 2), 'X').zfill(len(bin_f_str) // 4)
 
     # hex_str = hex_str.lstrip("0") # remove leading zeros
     hex_str = "0" if len(hex_str) == 0 else hex_str
@@ -105,6 +85,41 @@ def bin2hex(bin_str, WI=0):
 
 bin2hex_vec = np.vectorize(bin2hex)  # safer than frompyfunction()
 
+# Vectorized functions for converting integers to binary strings with numpy's
+# automatic type casting and for inserting a binary point in string `bin_str`
+# after position `pos`. Usage: _insert_binary_point(bin_str, pos)
+_binary_repr_vec = np.frompyfunc(np.binary_repr, 2, 1)
+_insert_binary_point = np.vectorize(lambda bin_str, pos: (
+                                    bin_str[:pos+1] + "." + bin_str[pos+1:]))
+
+
+def _bin_codes_vec(y_int, W: int):
+    """
+    Return the ASCII codes of the two's complement binary strings with `W` bits
+    of the integer array `y_int` as a uint8 array with an additional last axis
+    of length `W`.
+
+    Return `None` for scalars and when not all values fit into `W` bits, the
+    strings need to be created with `np.binary_repr()` then.
+    """
+    if np.ndim(y_int) == 0 or not 1 <= W <= 63 or y_int.size == 0\
+            or y_int.min() < -(1 << (W - 1)) or y_int.max() >= 1 << (W - 1):
+        return None
+    # negative values wrap around to their two's complement in uint64
+    y_uint = y_int.astype(np.uint64) & np.uint64((1 << W) - 1)
+    bits = (y_uint[..., np.newaxis] >> np.arange(W - 1, -1, -1, dtype=np.uint64))\
+        & np.uint64(1)
+    return bits.astype(np.uint8) + np.uint8(ord('0'))
+
+
+def _codes2str(codes):
+    """
+    Convert the uint8 array `codes` with ASCII codes along the last axis to
+    an array of str with one dimension less.
+    """
+    codes = np.ascontiguousarray(codes)
+    return codes.view(f'S{codes.shape[-1]}')[..., 0].astype(str)
+
 
 # ------------------------------------------------------------------------------
 def dec2hex(val, nbits, WF=0):
@@ -132,6 +147,10 @@ def dec2hex(val, nbits, WF=0):
 
 
 # ------------------------------------------------------------------------------
+# ASCII codes of CSD characters
+_CSD_PLUS, _CSD_MINUS, _CSD_ZERO, _CSD_DOT = b'+-0.'
+
+
 def dec2csd(dec_val, WF=0):
     """
     Convert the argument `dec_val` to a string in CSD Format.
@@ -158,66 +177,69 @@ def dec2csd(dec_val, WF=0):
     # figure out binary range, special case for 0
     if dec_val == 0:
         return '0'
-    if np.abs(dec_val) < 1.0:
+    if abs(dec_val) < 1.0:
         k = 0
     else:
-        k = int(np.ceil(np.log2(np.abs(dec_val) * 1.5)))
+        k = math.ceil(math.log2(abs(dec_val) * 1.5))
 
     # logger.debug("CSD: Converting {0:f} to {1:d}.{2:d} format".format(dec_val, k, WF))
 
     # Initialize CSD calculation
-    csd_digits = []
+    csd_digits = bytearray()  # ASCII codes of the CSD characters
+    append = csd_digits.append
     remainder = dec_val
     prev_non_zero = False
     k -= 1  # current exponent in the CSD string under construction
+    pow2_k = math.ldexp(1.0, k)  # = 2 ** k, halved in every iteration
 
-    while(k >= -WF):  # has the last fractional digit been reached
-        limit = pow(2.0, k+1) / 3.0
+    while k >= -WF:  # has the last fractional digit been reached
+        limit = 2 * pow2_k / 3.0
 
         # logger.debug("\t{0} - {1}".format(remainder, limit))
 
         # decimal point?
         if k == -1:
-            if csd_digits == []:
+            if not csd_digits:
                 if dec_val > limit:
                     remainder -= 1
-                    csd_digits.extend(['+.'])
+                    csd_digits += b'+.'
                     prev_non_zero = True
                 elif dec_val < -limit:
                     remainder += 1
-                    csd_digits.extend(['-.'])
+                    csd_digits += b'-.'
                     prev_non_zero = True
                 else:
-                    csd_digits.extend(['0.'])
+                    csd_digits += b'0.'
             else:
-                csd_digits.extend(['.'])
+                append(_CSD_DOT)
 
         # convert the number
         if prev_non_zero:
-            csd_digits.extend(['0'])
+            append(_CSD_ZERO)
             prev_non_zero = False
 
         elif remainder > limit:
-            csd_digits.extend(['+'])
-            remainder -= pow(2.0, k)
+            append(_CSD_PLUS)
+            remainder -= pow2_k
             prev_non_zero = True
 
         elif remainder < -limit:
-            csd_digits.extend(['-'])
-            remainder += pow(2.0, k)
+            append(_CSD_MINUS)
+            remainder += pow2_k
             prev_non_zero = True
 
         else:
-            csd_digits.extend(['0'])
+            append(_CSD_ZERO)
             prev_non_zero = False
 
         k -= 1
+        pow2_k *= 0.5
 
     # Always have something before the point
 #    if np.abs(dec_val) < 1.0:
 #        csd_digits.insert(0, '0')
 
-    csd_str = "".join(csd_digits)
+    csd_str = csd_digits.decode('ascii')
 
     # logger.debug("CSD result = {0}".format(csd_str))
 
@@ -227,7 +249,100 @@ def dec2csd(dec_val, WF=0):
     return csd_str
 
 
-dec2csd_vec = np.frompyfunc(dec2csd, 2, 1)
+_dec2csd_ufunc = np.frompyfunc(dec2csd, 2, 1)
+
+
+@njit(cache=True)
+def _dec2csd_kernel(dec_vals, WF, out):
+    """
+    Numba kernel for `dec2csd()`: Write the CSD strings of the finite floats in
+    the 1D array `dec_vals` with `WF` fractional places as ASCII codes into the
+    rows of the zero-initialized uint8 array `out`.
+    """
+    for i in range(dec_vals.size):
+        dec_val = dec_vals[i]
+        if dec_val == 0:
+            out[i, 0] = _CSD_ZERO
+            continue
+        if abs(dec_val) < 1.0:
+            k = 0
+        else:
+            k = int(math.ceil(math.log2(abs(dec_val) * 1.5)))
+
+        idx = 0  # number of characters written
+        remainder = dec_val
+        prev_non_zero = False
+        k -= 1  # current exponent in the CSD string under construction
+        pow2_k = math.ldexp(1.0, k)  # = 2 ** k, halved in every iteration
+
+        while k >= -WF:  # has the last fractional digit been reached
+            limit = 2 * pow2_k / 3.0
+
+            # decimal point?
+            if k == -1:
+                if idx == 0:
+                    if dec_val > limit:
+                        remainder -= 1
+                        out[i, 0] = _CSD_PLUS
+                        prev_non_zero = True
+                    elif dec_val < -limit:
+                        remainder += 1
+                        out[i, 0] = _CSD_MINUS
+                        prev_non_zero = True
+                    else:
+                        out[i, 0] = _CSD_ZERO
+                    idx = 1
+                out[i, idx] = _CSD_DOT
+                idx += 1
+
+            # convert the number
+            if prev_non_zero:
+                out[i, idx] = _CSD_ZERO
+                prev_non_zero = False
+
+            elif remainder > limit:
+                out[i, idx] = _CSD_PLUS
+                remainder -= pow2_k
+                prev_non_zero = True
+
+            elif remainder < -limit:
+                out[i, idx] = _CSD_MINUS
+                remainder += pow2_k
+                prev_non_zero = True
+
+            else:
+                out[i, idx] = _CSD_ZERO
+                prev_non_zero = False
+
+            idx += 1
+            k -= 1
+            pow2_k *= 0.5
+
+
+def dec2csd_vec(dec_vals, WF=0):
+    """
+    Vectorized version of `dec2csd()`: Convert the scalar or array-like `dec_vals`
+    to (an object array of) strings in CSD format with `WF` fractional places.
+
+    Arrays of finite floats are converted by a numba kernel when numba is
+    installed, everything else element by element via `dec2csd()`.
+    """
+    if not NUMBA or not isinstance(dec_vals, np.ndarray) or dec_vals.dtype.kind != 'f'\
+            or dec_vals.ndim == 0 or dec_vals.size == 0\
+            or not np.all(np.isfinite(dec_vals)):
+        return _dec2csd_ufunc(dec_vals, WF)
+
+    WF = int(WF)
+    dec_flat = np.ascontiguousarray(dec_vals, dtype=np.float64).ravel()
+    # max. number of characters: integer places, radix point and leading zero
+    # or sign plus the fractional places
+    max_abs = np.max(np.abs(dec_flat))
+    k_max = math.ceil(math.log2(max_abs * 1.5)) if max_abs >= 1.0 else 0
+    out = np.zeros((dec_flat.size, k_max + WF + 2), dtype=np.uint8)
+    _dec2csd_kernel(dec_flat, WF, out)
+    # interpret rows as zero-padded byte strings and convert them to str objects
+    csd_strs = out.view(f'S{out.shape[1]}').ravel().astype(str).astype(object)
+    return csd_strs.reshape(dec_vals.shape)
 
 
 # ------------------------------------------------------------------------------
@@ -282,8 +397,107 @@ def csd2dec(csd_str):
     return dec_val
 
 
-# csd2dec_vec = np.frompyfunc(csd2dec, 1, 1)
-csd2dec_vec = np.vectorize(csd2dec)  # safer than np.frompyfunc()
+# lookup table for the signs of CSD digits, indexed by the character code
+_CSD_SIGNS = np.zeros(256, dtype=np.int8)
+_CSD_SIGNS[ord('+')] = 1
+_CSD_SIGNS[ord('-')] = -1
+
+
+def csd2dec_vec(csd_arr):
+    """
+    Vectorized version of `csd2dec()`: Convert the CSD strings in the array-like
+    `csd_arr` to decimals, returning an ndarray of float with the same shape.
+
+    The strings are left-padded with zeros to the same length and converted to
+    a 2D array of signs, which is multiplied with the powers of two in one go.
+    """
+    csd_arr = np.asarray(csd_arr)
+    csd_list = [str(c) for c in csd_arr.ravel()]
+    L = max(map(len, csd_list), default=0)
+    buf = "".join([c.rjust(L, '0') for c in csd_list]).encode('ascii', 'replace')
+    signs = _CSD_SIGNS[np.frombuffer(buf, dtype=np.uint8)].reshape(len(csd_list), L)
+    return (signs @ np.ldexp(1., np.arange(L - 1, -1, -1))).reshape(csd_arr.shape)
+
+
+# Types treated as scalars by `np.isscalar()`, for a cheaper `isinstance()` check
+# (most frequent types first)
+_SCALAR_TYPES = (str, float, int, np.generic, bytes, numbers.Number)
+
+# Real scalar types processed by `Fixed._fixp_scalar()`
+_REAL_SCALAR_TYPES = {float, int, np.float64, np.int64, np.int32}
+
+# Integer codes for the quantization methods supported by `_fixp_kernel()`
+_FIXP_QUANT_CODES = {'floor': 0, 'round': 1, 'rint': 1, 'fix': 2, 'ceil': 3, 'none': 4}
+
+
+@njit(cache=True)
+def _fixp_kernel(y, scale_in, scale_out, MIN_q, MAX_q, MSB_q, quant, ovfl,
+                 yq, ovr_flag):
+    """
+    Numba kernel for `Fixed.fixp()` with a 1D float64 array `y`: Scale the
+    elements by `scale_in`, quantize them with method `quant` (see
+    `_FIXP_QUANT_CODES`), handle overflows w.r.t. `MIN_q` and `MAX_q` with
+    the mode `ovfl` (0: 'none', 1: 'sat', 2: 'wrap') and scale them by
+    `scale_out`.
+
+    The results and overflow flags are written to `yq` and `ovr_flag`, the number
+    of positive and negative overflows is returned. The operations are the same
+    as in `fixp()`, giving bit-identical results.
+    """
+    # quantize in a separate loop per method for vectorization
+    if quant == 0:
+        for i in range(y.size):
+            yq[i] = np.floor(y[i] * scale_in)
+    elif quant == 1:
+        for i in range(y.size):
+            yq[i] = np.rint(y[i] * scale_in)
+    elif quant == 2:
+        for i in range(y.size):
+            yq[i] = np.trunc(y[i] * scale_in)
+    elif quant == 3:
+        for i in range(y.size):
+            yq[i] = np.ceil(y[i] * scale_in)
+    else:
+        for i in range(y.size):
+            yq[i] = y[i] * scale_in
+
+    N_over_pos = 0
+    N_over_neg = 0
+    if ovfl == 0:
+        for i in range(y.size):
+            yq[i] *= scale_out
+    elif ovfl == 1:
+        for i in range(y.size):
+            v = yq[i]
+            over_neg = v < MIN_q
+            over_pos = v > MAX_q
+            N_over_neg += over_neg
+            N_over_pos += over_pos
+            ovr_flag[i] = over_pos - over_neg
+            yq[i] = min(max(v, MIN_q), MAX_q) * scale_out
+    else:
+        P = 4. * MSB_q
+        for i in range(y.size):
+            v = yq[i]
+            over_neg = v < MIN_q
+            over_pos = v > MAX_q
+            N_over_neg += over_neg
+            N_over_pos += over_pos
+            ovr_flag[i] = over_pos - over_neg
+            if over_neg or over_pos:
+                v = v - P * np.trunc((math.copysign(2. * MSB_q, v) + v) / P)
+            yq[i] = v * scale_out
+    return N_over_pos, N_over_neg
+
+
+# compiled regexes for removing illegal characters from the number formats,
+# ^ means "not", | means "or" and \ escapes
+FRMT_REGEX = {
+        'bin': re.compile(r'[^0|1|.|,|\-]'),
+        'csd': re.compile(r'[^0|\+|\-|.|,]'),
+        'dec': re.compile(r'[^0-9Ee|.|,|\-]'),
+        'hex': re.compile(r'[^0-9A-Fa-f|.|,|\-]')
+            }
 
 
 # ------------------------------------------------------------------------
@@ -469,16 +683,6 @@ class Fixed(object):
         self.set_qdict({})  # trigger calculation of parameters
         self.resetN()       # initialize overflow-counter
 
-        # arguments for regex replacement with illegal characters
-        # ^ means "not", | means "or" and \ escapes
-        self.FRMT_REGEX = {
-                'bin': r'[^0|1|.|,|\-]',
-                'csd': r'[^0|\+|\-|.|,]',
-                'dec': r'[^0-9Ee|.|,|\-]',
-                'hex': r'[^0-9A-Fa-f|.|,|\-]'
-                        }
-        # provide frmt2float function for arrays, swallow the `self` argument
-        self.frmt2float_vec = np.vectorize(self.frmt2float_scalar, excluded='self')
 
     def verify_q_dict_keys(self, q_dict: dict) -> None:
         """
@@ -509,21 +713,48 @@ class Fixed(object):
         # sanitize WI and WF
         self.q_dict['WI'] = int(self.q_dict['WI'])
         self.q_dict['WF'] = abs(int(self.q_dict['WF']))
+        self._W = self.q_dict['WI'] + self.q_dict['WF'] + 1  # total word length
+
+        # Constants and functions used by `fixp()` for the current settings
+        self._pow2_wf = 2. ** self.q_dict['WF']
+        self._inv_pow2_wf = 1. / self._pow2_wf
+        # quantization function, `None` for 'dsm' and unknown methods
+        self._quant_fn = {'floor': np.floor, 'round': np.round, 'fix': np.fix,
+                          'ceil': np.ceil, 'rint': np.rint, 'none': lambda x: x
+                          }.get(self.q_dict['quant'])
+        # overflow behaviour, -1 for unknown methods
+        self._ovfl_mode = {'none': 0, 'sat': 1, 'wrap': 2}.get(self.q_dict['ovfl'], -1)
+        # quantization code for the numba kernel, -1 when not supported
+        self._quant_code = _FIXP_QUANT_CODES.get(self.q_dict['quant'], -1)
 
         # Calculate min., max., LSB and MSB from word lengths
         if fb.fil[0]['qfrmt'] == 'qint':
+            # integer weights, calculated exactly by bit shifts where possible
+            W_MSB = self.q_dict['WI'] + self.q_dict['WF'] - 1
             self.LSB = 1
-            self.MSB = 2 ** (self.q_dict['WI'] + self.q_dict['WF']- 1)
+            self.MSB = 1 << W_MSB if W_MSB >= 0 else 2 ** W_MSB
         else:
             self.LSB = 2. ** -self.q_dict['WF']
             self.MSB = 2. ** (self.q_dict['WI'] - 1)
 
+        self._inv_LSB = 1. / self.LSB  # exact, LSB is a power of two
         self.MAX =  2. * self.MSB - self.LSB
         self.MIN = -2. * self.MSB
 
+        # MSB, MIN and MAX in the scale of the quantization step (= 1) in `fixp()`
+        self._MSB_q = self.MSB * self._pow2_wf
+        self._MIN_q = self.MIN * self._pow2_wf
+        self._MAX_q = self.MAX * self._pow2_wf
+        # Quantized values are integers, wrap them in the integer domain when the
+        # range of the two's complement representation fits into int64
+        self._wrap_int = self.q_dict['quant'] in {'floor', 'round', 'fix', 'ceil', 'rint'}\
+            and 1. <= 2. * self._MSB_q <= 2.**61
+        # `fixp()` for real scalars, specialized for the current settings
+        self._fixp_scalar = self._make_fixp_scalar()
+
         # Calculate required number of places for different bases from total
         # number of bits:
-        W = self.q_dict['WI'] + self.q_dict['WF'] + 1
+        W = self._W
         #
         if fb.fil[0]['fx_base'] == 'dec':
             self.places = int(
@@ -540,6 +771,60 @@ class Fixed(object):
             raise Exception(
                 u'Unknown number format "{0:s}"!'.format(fb.fil[0]['fx_base']))
 
+# ------------------------------------------------------------------------------
+    def _make_fixp_scalar(self):
+        """
+        Return a function that quantizes a finite float `y` (already multiplied
+        by `scale` and 2**WF) with the current quantization and overflow settings
+        and updates the overflow counters, giving the same result as the general
+        path of `fixp()` with plain Python floats and the `math` module.
+
+        Return `None` when the settings are not supported ('dsm', unknown modes).
+        """
+        quant_fn = {'floor': math.floor, 'round': round, 'rint': round,
+                    'fix': math.trunc, 'ceil': math.ceil, 'none': None
+                    }.get(self.q_dict['quant'], False)
+        if quant_fn is False or self._ovfl_mode < 0:
+            return None
+
+        ovfl_mode = self._ovfl_mode
+        MIN_q, MAX_q, MSB_q = self._MIN_q, self._MAX_q, self._MSB_q
+        inv_pow2_wf = self._inv_pow2_wf
+
+        def fixp_scalar(y: float) -> float:
+            if quant_fn is None:
+                yq = y
+            else:
+                # round() rounds half to even like np.round() / np.rint(), the
+                # sign of zero is restored as the int results have none
+                yq = float(quant_fn(y))
+                if yq == 0:
+                    yq = math.copysign(0., y)
+
+            if ovfl_mode == 0:  # 'none'
+                self.N_over_neg = self.N_over_pos = self.N_over = 0
+                self.ovr_flag = 0
+            else:
+                over_neg = yq < MIN_q
+                over_pos = yq > MAX_q
+                self.ovr_flag = over_pos - over_neg
+                self.N_over_neg += over_neg
+                self.N_over_pos += over_pos
+                self.N_over = self.N_over_neg + self.N_over_pos
+                if ovfl_mode == 1:  # 'sat'
+                    if over_pos:
+                        yq = MAX_q
+                    elif over_neg:
+                        yq = MIN_q
+                elif over_pos or over_neg:  # 'wrap'
+                    P = 4. * MSB_q
+                    yq = yq - P * math.trunc((math.copysign(2. * MSB_q, yq) + yq) / P)
+
+            self.q_dict.update({'N_over': self.N_over})
+            return yq * inv_pow2_wf
+
+        return fixp_scalar
+
 # ------------------------------------------------------------------------------
     def fixp(self, y, scaling='mult'):
         """
@@ -621,21 +906,35 @@ class Fixed(object):
         scaling = scaling.lower()
         # use values from dict for initialization
         if fb.fil[0]['qfrmt'] == 'qint':
-            self.scale = 2. ** self.q_dict['WF']
+            self.scale = float(1 << self.q_dict['WF'])  # WF >= 0, see set_qdict()
         else:
             self.scale = 1
 
+        # Real scalars are processed by the function specialized in `set_qdict()`
+        if type(y) in _REAL_SCALAR_TYPES and self._fixp_scalar is not None\
+                and not logger.isEnabledFor(logging.DEBUG):
+            if scaling in {'mult', 'multdiv'}:
+                y_q = float(y) * (self.scale * self._pow2_wf)
+            else:
+                y_q = float(y) * self._pow2_wf
+            if math.isfinite(y_q):
+                self.N += 1
+                yq = self._fixp_scalar(y_q)
+                if scaling in {'div', 'multdiv'}:
+                    yq = yq / self.scale
+                return yq
+
         if np.shape(y):
             # Input is an array:
-            #   Create empty arrays for result and overflows with same shape as y
             #   for speedup, test for invalid types
             SCALAR = False
             y = np.asarray(y)  # convert lists / tuples / ... to numpy arrays
-            yq = np.zeros(y.shape)
-            over_pos = over_neg = np.zeros(y.shape, dtype=bool)
-            # ovr_flag = np.zeros(y.shape, dtype=int)
 
             if np.issubdtype(y.dtype, np.number):  # numpy number type
+                if y.dtype.kind in {'i', 'u', 'f'}:
+                    # convert real numbers to float64 once instead of in every
+                    # arithmetic operation below
+                    y = y.astype(np.float64, copy=False)
                 self.N += y.size
             elif y.dtype.kind in {'U', 'S'}:  # string or unicode
                 try:
@@ -667,22 +966,37 @@ class Fixed(object):
                 y = str(y)
                 y = y.replace(' ', '')  # remove all whitespace
                 try:
-                    y = float(y)
+                    # only strings with an imaginary unit can be complex numbers,
+                    # convert them directly without failing with float() first
+                    if 'j' in y or 'J' in y:
+                        y = complex(y)
+                    else:
+                        y = float(y)
                 except (TypeError, ValueError):
                     try:
                         y = complex(y)
                     except (TypeError, ValueError) as e:
                         logger.error(f"'{y}' cannot be converted to a number.")
                         y = 0.0
-            over_pos = over_neg = yq = 0
             self.N += 1
 
-        # convert pseudo-complex (imag = 0) and complex values to real
-        y = np.real_if_close(y)
-        if np.iscomplexobj(y):
-            logger.warning("Casting complex values to real before quantization!")
-            # quantizing complex objects is not supported yet
-            y = y.real
+        # convert pseudo-complex (imag = 0) and complex values to real, skip
+        # this for the common case of real inputs
+        if SCALAR:
+            is_complex = isinstance(y, (complex, np.complexfloating))
+        else:
+            is_complex = y.dtype.kind == 'c'
+        if is_complex:
+            y = np.real_if_close(y)
+            if np.iscomplexobj(y):
+                logger.warning("Casting complex values to real before quantization!")
+                # quantizing complex objects is not supported yet
+                y = y.real
+
+        # Real float arrays are processed by the fused numba kernel when available
+        if NUMBA and not SCALAR and y.dtype == np.float64 and self._quant_code >= 0\
+                and self._ovfl_mode >= 0 and not logger.isEnabledFor(logging.DEBUG):
+            return self._fixp_numba(y, scaling)
 
         y_in = y  # store y before scaling / quantizing
         # ======================================================================
@@ -690,8 +1004,12 @@ class Fixed(object):
         #       Multiply by `scale` factor before requantization and saturation
         #       when `scaling=='mult'`or 'multdiv'
         # ======================================================================
+        #       Both `scale` and the factor 2**WF for quantization (3) are powers
+        #       of two, their product is applied in a single multiplication.
         if scaling in {'mult', 'multdiv'}:
-            y = y * self.scale
+            y = y * (self.scale * self._pow2_wf)
+        else:
+            y = y * self._pow2_wf  # not in-place, `y` may be the caller's array
 
         # ======================================================================
         # (3) : QUANTIZATION
@@ -699,21 +1017,18 @@ class Fixed(object):
         #       quantization step size = 1.
         #       Next, apply selected quantization method to convert
         #       floating point inputs to "fixpoint integers".
-        #       Finally, divide by 2**WF to restore original scale.
+        #       Finally, divide by 2**WF to restore original scale after
+        #       handling overflows (4).
         # ======================================================================
 
-        y *= 2. ** self.q_dict['WF']
-
-        if self.q_dict['quant'] == 'floor':
-            yq = np.floor(y)  # largest integer i, such that i <= x (= binary truncation)
-        elif self.q_dict['quant'] == 'round':
-            yq = np.round(y)  # rounding, also = binary rounding
-        elif self.q_dict['quant'] == 'fix':
-            yq = np.fix(y)  # round to nearest integer towards zero ("Betragsschneiden")
-        elif self.q_dict['quant'] == 'ceil':
-            yq = np.ceil(y)  # smallest integer i, such that i >= x
-        elif self.q_dict['quant'] == 'rint':
-            yq = np.rint(y)  # round towards nearest int
+        if self._quant_fn is not None:
+            # 'floor': largest integer i, such that i <= x (= binary truncation)
+            # 'round': rounding, also = binary rounding
+            # 'fix':   round to nearest integer towards zero ("Betragsschneiden")
+            # 'ceil':  smallest integer i, such that i >= x
+            # 'rint':  round towards nearest int
+            # 'none':  return unquantized value
+            yq = self._quant_fn(y)
         elif self.q_dict['quant'] == 'dsm':
             if DS:
                 # Synthesize DSM loop filter,
@@ -730,48 +1045,76 @@ class Fixed(object):
             else:
                 raise Exception('"deltasigma" Toolbox not found.\n'
                                 'Try installing it with "pip install deltasigma".')
-        elif self.q_dict['quant'] == 'none':
-            yq = y  # return unquantized value
         else:
             raise Exception(
                 f'''Unknown Requantization type "{self.q_dict['quant']:s}"!''')
 
-        yq /= 2. ** self.q_dict['WF']
-
-        logger.warning(f"scaling={scaling} y_in={y_in} | y={y} | yq={yq}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("scaling=%s y_in=%s | y=%s | yq=%s", scaling, y_in, y, yq)
 
         # ======================================================================
         # (4) : Handle Overflow / saturation w.r.t. to the MSB, returning a
         #       result in the range MIN = -2*MSB ... + 2*MSB-LSB = MAX
+        #       This is done with the limits `_MIN_q`, `_MAX_q` and `_MSB_q` in
+        #       the scale of the quantization step, before dividing by 2**WF.
         # ====================================================================
-        if self.q_dict['ovfl'] == 'none':
+        if self._ovfl_mode == 0:  # 'none'
             # set all overflow flags to zero
             self.N_over_neg = self.N_over_pos = self.N_over = 0
             self.ovr_flag = np.zeros_like(yq)
         else:
             # Bool. vectors with '1' for every neg./pos overflow:
-            over_neg = (yq < self.MIN)
-            over_pos = (yq > self.MAX)
+            over_neg = (yq < self._MIN_q)
+            over_pos = (yq > self._MAX_q)
             # create flag / array of flags for pos. / neg. overflows
-            self.ovr_flag = over_pos.astype(int) - over_neg.astype(int)
+            self.ovr_flag = np.subtract(over_pos, over_neg, dtype=int)
             # No. of pos. / neg. / all overflows occured since last reset:
-            self.N_over_neg += np.sum(over_neg)
-            self.N_over_pos += np.sum(over_pos)
+            self.N_over_neg += np.count_nonzero(over_neg)
+            self.N_over_pos += np.count_nonzero(over_pos)
             self.N_over = self.N_over_neg + self.N_over_pos
 
             # Replace overflows with Min/Max-Values (saturation):
-            if self.q_dict['ovfl'] == 'sat':
-                yq = np.where(over_pos, self.MAX, yq)  # (cond, true, false)
-                yq = np.where(over_neg, self.MIN, yq)
+            if self._ovfl_mode == 1:  # 'sat'
+                # only replace the overflows like `_fixp_kernel()` and
+                # `_fixp_scalar()`, np.clip() would turn -0. into 0. for MAX = 0
+                if SCALAR:
+                    if over_pos:
+                        yq = self._MAX_q
+                    elif over_neg:
+                        yq = self._MIN_q
+                else:
+                    yq[over_pos] = self._MAX_q
+                    yq[over_neg] = self._MIN_q
             # Replace overflows by two's complement wraparound (wrap)
-            elif self.q_dict['ovfl'] == 'wrap':
-                yq = np.where(
-                    over_pos | over_neg, yq - 4. * self.MSB * np.fix(
-                        (np.sign(yq) * 2 * self.MSB + yq) / (4 * self.MSB)), yq)
+            elif self._ovfl_mode == 2:  # 'wrap'
+                if self._wrap_int and not SCALAR and yq.dtype == np.float64\
+                        and yq.size > 0 and -2.**62 < yq.min() and yq.max() < 2.**62:
+                    # The period 4 * MSB is a power of two, wrap the integer
+                    # values by masking their offset from MIN
+                    MIN_q = int(self._MIN_q)
+                    yq_i = yq.astype(np.int64)
+                    yq_i -= MIN_q
+                    yq_i &= int(4. * self._MSB_q) - 1
+                    yq_i += MIN_q
+                    # negative overflows by a multiple of the period are mapped
+                    # to + 2 * MSB like in the general case below
+                    yq_i[over_neg & (yq_i == MIN_q)] = -MIN_q
+                    # only replace the overflows, keeping the sign of zeros
+                    np.copyto(yq, yq_i, where=over_pos | over_neg)
+                else:
+                    # subtract the number of periods (4 * MSB) the value is out of
+                    # range, only the overflowing elements are replaced
+                    P = 4. * self._MSB_q
+                    yq_w = np.copysign(2. * self._MSB_q, yq)
+                    yq_w += yq
+                    yq_w = yq - P * np.fix(yq_w / P)
+                    yq = np.where(over_pos | over_neg, yq_w, yq)
             else:
                 raise Exception(
                     f"""Unknown overflow type "{self.q_dict['ovfl']:s}"!""")
 
+        yq *= self._inv_pow2_wf
+
         self.q_dict.update({'N_over': self.N_over})
 
         # ======================================================================
@@ -785,18 +1128,60 @@ class Fixed(object):
         if scaling in {'div', 'multdiv'}:
             yq = yq / self.scale
 
-        if SCALAR and isinstance(yq, np.ndarray):
-            yq = yq.item()  # convert singleton array to scalar
+        if SCALAR:
+            # return the same types as `_fixp_scalar()` for all scalar inputs,
+            # independent of the logging level
+            yq = float(yq)
+            self.ovr_flag = int(self.ovr_flag)
+
+        return yq
+
+    # --------------------------------------------------------------------------
+    def _fixp_numba(self, y, scaling: str):
+        """
+        Quantize the float64 array `y` with the numba kernel `_fixp_kernel()`,
+        updating the overflow counters and flags like `fixp()`
+        """
+        if scaling in {'mult', 'multdiv'}:
+            scale_in = self.scale * self._pow2_wf
+        else:
+            scale_in = self._pow2_wf
+        # divide by 2**WF and `scale` in one step, both are powers of two
+        if scaling in {'div', 'multdiv'}:
+            scale_out = self._inv_pow2_wf / self.scale
+        else:
+            scale_out = self._inv_pow2_wf
+
+        yq = np.empty(y.shape)
+        ovr_flag = np.empty(y.shape, dtype=int)
+        N_over_pos, N_over_neg = _fixp_kernel(
+            np.ascontiguousarray(y).reshape(-1), scale_in, scale_out,
+            self._MIN_q, self._MAX_q, self._MSB_q, self._quant_code,
+            self._ovfl_mode, yq.reshape(-1), ovr_flag.reshape(-1))
+
+        if self._ovfl_mode == 0:  # 'none'
+            # set all overflow flags to zero
+            self.N_over_neg = self.N_over_pos = self.N_over = 0
+            self.ovr_flag = np.zeros_like(yq)
+        else:
+            self.ovr_flag = ovr_flag
+            self.N_over_neg += N_over_neg
+            self.N_over_pos += N_over_pos
+            self.N_over = self.N_over_neg + self.N_over_pos
+        self.q_dict.update({'N_over': self.N_over})
 
         return yq
 
     # --------------------------------------------------------------------------
     def resetN(self):
         """ Reset counters and overflow-flag of Fixed object """
-        frm = inspect.stack()[1]
-        logger.debug("'reset_N' called from {0}.{1}():{2}.".
-                     format(inspect.getmodule(frm[0]).__name__.split('.')[-1],
-                            frm[3], frm[2]))
+        if logger.isEnabledFor(logging.DEBUG):
+            # only look at the calling frame, `inspect.stack()` would collect
+            # the frames and source context of the whole call stack
+            frm = inspect.currentframe().f_back
+            logger.debug("'reset_N' called from {0}.{1}():{2}.".
+                         format(frm.f_globals.get('__name__', '?').split('.')[-1],
+                                frm.f_code.co_name, frm.f_lineno))
         self.q_dict.update({'N_over': 0})
 
         self.ovr_flag = 0
@@ -837,7 +1222,8 @@ class Fixed(object):
 
         if y is None:
             return 0
-        elif np.isscalar(y):
+        SCALAR = isinstance(y, _SCALAR_TYPES)
+        if SCALAR:
             if not y:
                 return 0
             else:
@@ -855,7 +1241,7 @@ class Fixed(object):
                 y_float = np.float64(y)
             except ValueError:
                 try:
-                    y_float = np.complex(y)
+                    y_float = complex(y)
                 except Exception:
                     y_float = 0.0
                     logger.warning(
@@ -863,11 +1249,163 @@ class Fixed(object):
                         f'to float or complex, setting to zero.')
             return y_float
         # Convert various fixpoint formats to float
-        elif np.isscalar(y):
+        elif SCALAR:
             return self.frmt2float_scalar(y)
         else:
             return self.frmt2float_vec(y)
 
+    # --------------------------------------------------------------------------
+    def frmt2float_vec(self, y):
+        """
+        Convert the array-like `y` with strings or numbers in the format
+        `fb.fil[0]['fx_base']` to an ndarray of float with the same shape,
+        see `frmt2float_scalar()`.
+
+        For 'hex' and 'bin' formats, the strings are converted to (unquantized)
+        decimals one by one and quantized by a single call of `fixp()` on the
+        whole array. The same is done for 'dec' format arrays with numbers or
+        strings that can be cast to finite floats directly.
+        """
+        y = np.asarray(y)
+        frmt = fb.fil[0]['fx_base']
+
+        if frmt == 'dec' and (y.dtype.kind in {'i', 'u', 'U', 'S'} or y.dtype == np.float64):
+            try:
+                y_float = y.astype(np.float64)
+            except (TypeError, ValueError):
+                y_float = None
+            # non-finite values are sanitized to zero by the element-wise path
+            if y_float is not None and np.all(np.isfinite(y_float)):
+                return self.fixp(y_float, scaling='div')
+
+        y_flat = y.ravel()
+        if frmt not in {'hex', 'bin'}:
+            f = self.frmt2float_scalar
+            return np.fromiter((f(v) for v in y_flat), dtype=np.float64,
+                               count=y_flat.size).reshape(y.shape)
+
+        y_dec = np.zeros(y_flat.size)
+        for i, v in enumerate(y_flat):
+            frmt_strs = self._split_frmt_str(v, frmt)
+            if frmt_strs is None:
+                continue
+            try:
+                y_dec[i] = self._hexbin2dec(frmt_strs[1], frmt_strs[2], frmt)
+            except Exception as e:
+                logger.warning(e)
+
+        y_float = np.zeros(y_flat.size)
+        nonzero = y_dec != 0
+        if np.any(nonzero):
+            y_float[nonzero] = self.fixp(y_dec[nonzero], scaling='div')
+        return y_float.reshape(y.shape)
+
+    # --------------------------------------------------------------------------
+    def _split_frmt_str(self, y, frmt: str):
+        """
+        Remove illegal characters for format `frmt` and leading zeros from
+        `str(y)`, replace ',' by '.' and return a tuple with
+
+        - the sanitized string `val_str`
+        - the string `raw_str` with integer and fractional part joined
+        - the number of fractional places `frc_places`
+
+        or `None` when the sanitized string is empty.
+        """
+        val_str = FRMT_REGEX[frmt].sub('', str(y)).lstrip('0')
+        if len(val_str) == 0:
+            return None
+
+        val_str = val_str.replace(',', '.')  # ',' -> '.' for German-style numbers
+        if val_str[0] == '.':  # prepend '0' when the number starts with '.'
+            val_str = '0' + val_str
+
+        # count number of fractional places in string and join integer and
+        # fractional part, using the position of the radix point
+        pos = val_str.find('.')
+        if pos < 0:  # no fractional part
+            frc_places = 0
+            raw_str = val_str
+        elif val_str.find('.', pos + 1) < 0:
+            frc_places = len(val_str) - pos - 1
+            raw_str = val_str[:pos] + val_str[pos + 1:]
+        else:  # more than one radix point, no valid fractional part
+            frc_places = 0
+            raw_str = val_str.replace('.', '')
+
+        # logger.debug(f"y={y}, val_str={val_str}, raw_str={raw_str}")
+        return val_str, raw_str, frc_places
+
+    # --------------------------------------------------------------------------
+    def _hexbin2dec(self, raw_str: str, frc_places: int, frmt: str):
+        """
+        Return the decimal value (not quantized yet) of the 'hex' or 'bin' string
+        `raw_str` without radix point and `frc_places` fractional places.
+
+        - Check for a negative sign, use this information only in the end
+        - Divide by <base> ** <number of fractional places> for correct scaling
+        - Strip MSBs outside fixpoint range
+        - Transform numbers in negative 2's complement to negative floats.
+
+        Invalid strings raise an exception.
+        """
+        if fb.fil[0]['qfrmt'] == 'qint':
+            W = self._W
+        else:
+            W = self.q_dict['WI'] + 1
+        neg_sign = False
+
+        if raw_str[0] == '-':
+            neg_sign = True
+            raw_str = raw_str.lstrip('-')
+
+        if frmt == 'hex':
+            base = 16
+            frc_bits = 4 * frc_places
+        else:
+            base = 2
+            frc_bits = frc_places
+
+        # scaling factor base ** frc_places, a shift for binary numbers
+        scale = 1 << frc_bits
+        raw_int = int(raw_str, base)
+        y_dec = abs(raw_int / scale)
+
+        if y_dec == 0:
+            return 0
+
+        # number of integer bits = number of bits of the raw integer without
+        # the fractional bits, obtained exactly without a float log2
+        int_bits = max(raw_int.bit_length() - frc_bits, 0)
+        # When number is outside fixpoint range, discard MSBs:
+        if int_bits > W:
+            # Discard the upper `int_bits - W` digits of the binary string outside
+            # the valid range by masking the integer. Hex numbers are converted
+            # to binary strings without leading zeros, binary strings are
+            # truncated as they are (including leading zeros).
+            if frmt == 'hex':
+                n_digits = raw_int.bit_length()
+            else:
+                n_digits = len(raw_str)
+            raw_int &= (1 << (n_digits - int_bits + W)) - 1
+
+            # recalculate y_dec for truncated number
+            y_dec = raw_int / scale
+
+            if y_dec == 0:
+                return 0
+
+            int_bits = max(raw_int.bit_length() - frc_bits, 0)
+        # now, y_dec is in the correct range:
+        if int_bits <= W - 1:  # positive number
+            pass
+        elif int_bits == W:
+            # negative, calculate 2's complement
+            y_dec = y_dec - (1 << int_bits)
+        if neg_sign:
+            y_dec = -y_dec
+        return y_dec
+
     # --------------------------------------------------------------------------
     def frmt2float_scalar(self, y) -> float:
         """
@@ -880,25 +1418,15 @@ class Fixed(object):
         remove illegal characters and trailing zeros
         """
         frmt = fb.fil[0]['fx_base']
-        val_str = re.sub(self.FRMT_REGEX[frmt], r'', str(y)).lstrip('0')
-        if len(val_str) > 0:
-            val_str = val_str.replace(',', '.')  # ',' -> '.' for German-style numbers
-            if val_str[0] == '.':  # prepend '0' when the number starts with '.'
-                val_str = '0' + val_str
-
-            # count number of fractional places in string
-            try:
-                # split into integer and fractional places
-                _, frc_str = val_str.split('.')
-                frc_places = len(frc_str)
-            except ValueError:  # no fractional part
-                frc_places = 0
-
-            raw_str = val_str.replace('.', '')  # join integer and fractional part
+        if frmt == 'dec' and type(y) in _REAL_SCALAR_TYPES and abs(y) < 2.**1023:
+            # finite real numbers (no nan or inf, which are stripped to "")
+            # don't need the round trip via a string
+            return self.fixp(y, scaling='div')
 
-            # logger.debug(f"y={y}, val_str={val_str}, raw_str={raw_str}")
-        else:
+        frmt_strs = self._split_frmt_str(y, frmt)
+        if frmt_strs is None:
             return 0.0
+        val_str, raw_str, frc_places = frmt_strs
 
         # (1) calculate the decimal value of the input string using np.float64()
         #     which takes the number of decimal places into account.
@@ -913,57 +1441,14 @@ class Fixed(object):
 
         elif frmt in {'hex', 'bin'}:
             # - Glue integer and fractional part to a string without radix point
-            # - Check for a negative sign, use this information only in the end
-            # - Divide by <base> ** <number of fractional places> for correct scaling
-            # - Strip MSBs outside fixpoint range
-            # - Transform numbers in negative 2's complement to negative floats.
+            # - Calculate the decimal value, see `_hexbin2dec()`
             # - Calculate the fixpoint representation for correct saturation /
             #   quantization
-            if fb.fil[0]['qfrmt'] == 'qint':
-                W = self.q_dict['WI'] + self.q_dict['WF'] + 1
-            else:
-                W = self.q_dict['WI'] + 1
-            neg_sign = False
             try:
-                if raw_str[0] == '-':
-                    neg_sign = True
-                    raw_str = raw_str.lstrip('-')
-
-                if frmt == 'hex':
-                    base = 16
-                else:
-                    base = 2
-
-                y_dec = abs(int(raw_str, base) / base**frc_places)
-
-                if y_dec == 0:  # avoid log2(0)
+                y_dec = self._hexbin2dec(raw_str, frc_places, frmt)
+                if y_dec == 0:
                     return 0
-
-                int_bits = max(int(np.floor(np.log2(y_dec))) + 1, 0)
-                # When number is outside fixpoint range, discard MSBs:
-                if int_bits > W:
-                    # convert hex numbers to binary string for discarding bits bit-wise
-                    if frmt == 'hex':
-                        raw_str = np.binary_repr(int(raw_str, 16))
-                    # discard the upper bits outside the valid range
-                    raw_str = raw_str[int_bits - W:]
-
-                    # recalculate y_dec for truncated string
-                    y_dec = int(raw_str, 2) / base**frc_places
-
-                    if y_dec == 0:  # avoid log2(0) error in code below
-                        return 0
-
-                    int_bits = max(int(np.floor(np.log2(y_dec))) + 1, 0)
-                # now, y_dec is in the correct range:
-                if int_bits <= W - 1:  # positive number
-                    pass
-                elif int_bits == W:
-                    # negative, calculate 2's complement
-                    y_dec = y_dec - (1 << int_bits)
                 # quantize / saturate / wrap & scale the integer value:
-                if neg_sign:
-                    y_dec = -y_dec
                 y_float = self.fixp(y_dec, scaling='div')
             except Exception as e:
                 logger.warning(e)
@@ -1011,23 +1496,7 @@ class Fixed(object):
         numeric format set in `fb.fil[0]['fx_base'])`. It has the same shape as `y`.
         For all formats except `float` a fixpoint representation with
         a total number of W = WI + WF + 1 binary digits is returned.
-
-
-        Define vectorized functions using numpys automatic type casting:
-        Vectorized functions for inserting binary point in string `bin_str`
-        after position `pos`.
-
-        Usage:  insert_binary_point(bin_str, pos)
-
-        Parameters: bin_str : string
-                    pos     : integer
         """
-        insert_binary_point = np.vectorize(lambda bin_str, pos: (
-                                    bin_str[:pos+1] + "." + bin_str[pos+1:]))
-
-        binary_repr_vec = np.frompyfunc(np.binary_repr, 2, 1)
-        # ======================================================================
-
         if fb.fil[0]['qfrmt'] == 'float':  # return float input value unchanged (no string)
             return y
         elif fb.fil[0]['qfrmt'] == 'float32':
@@ -1040,6 +1509,9 @@ class Fixed(object):
 
         if fb.fil[0]['fx_base'] == 'dec':
             if self.q_dict['WF'] == 0 or fb.fil[0]['qfrmt'] == 'qint':
+                if np.ndim(y_fix) == 0 and math.isfinite(y_fix):
+                    # scalar, e.g. from itemDelegate: plain int is much cheaper
+                    return int(y_fix)
                 y_str = np.int64(y_fix)  # get rid of trailing zero
                 # y_str = np.char.mod('%d', y_fix)
                 # elementwise conversion from integer (%d) to string
@@ -1050,29 +1522,61 @@ class Fixed(object):
         elif fb.fil[0]['fx_base'] == 'csd':
             if fb.fil[0]['qfrmt'] == 'qint':
                 # integer case, convert with 0 fractional bits
-                y_str = dec2csd_vec(y_fix, 0)
+                WF = 0
             else:
                 # fractional case, convert with WF fractional bits
-                y_str = dec2csd_vec(y_fix, self.q_dict['WF'])
+                WF = self.q_dict['WF']
+            if np.ndim(y_fix) == 0:
+                # scalar, e.g. from itemDelegate: no need for vectorization
+                return dec2csd(float(y_fix), WF)
+            y_str = dec2csd_vec(y_fix, WF)
 
         elif fb.fil[0]['fx_base'] in {'bin', 'hex'}:
             # represent fixpoint number as integer in the range -2**(W-1) ... 2**(W-1)
-            y_fix_int = np.int64(np.round(y_fix / self.LSB))
-            # convert to (array of) string with 2's complement binary
-            y_bin_str = binary_repr_vec(y_fix_int, self.q_dict['WI'] + self.q_dict['WF'] + 1)
-
+            # multiplying by the reciprocal of LSB (a power of two) is exact
+            if isinstance(y_fix, np.ndarray):
+                # `y_fix` is a new array returned by `fixp()`, reuse it as buffer
+                np.multiply(y_fix, self._inv_LSB, out=y_fix)
+                y_fix_int = np.rint(y_fix, out=y_fix).astype(np.int64)
+            else:
+                y_fix_int = np.int64(np.rint(y_fix * self._inv_LSB))
+            W = self._W
             if fb.fil[0]['qfrmt'] == 'qint':
-                WI = self.q_dict['WI'] + self.q_dict['WF'] + 1
+                WI = W
             else:
                 WI = self.q_dict['WI']
+
+            if np.ndim(y_fix_int) == 0:
+                # scalar, e.g. from itemDelegate: no need for vectorization
+                y_bin_str = np.binary_repr(int(y_fix_int), W)
+                if fb.fil[0]['fx_base'] == 'hex':
+                    return bin2hex(y_bin_str, WI)
+                elif fb.fil[0]['qfrmt'] == 'qint':
+                    return y_bin_str
+                else:
+                    return y_bin_str[:WI + 1] + "." + y_bin_str[WI + 1:]
+
+            # ASCII codes of the 2's complement binary strings for arrays
+            bin_codes = _bin_codes_vec(y_fix_int, W)
+            if bin_codes is None:
+                # convert to (array of) string with 2's complement binary
+                y_bin_str = _binary_repr_vec(y_fix_int, W)
+            elif fb.fil[0]['fx_base'] == 'hex' or fb.fil[0]['qfrmt'] == 'qint'\
+                    or not 0 <= WI + 1 <= W:
+                y_bin_str = _codes2str(bin_codes).astype(object)
+            else:
+                # insert radix point after the integer bits as a column of '.'
+                y_str = _codes2str(np.insert(bin_codes, WI + 1, ord('.'), axis=-1))
+                y_bin_str = None
+
             if fb.fil[0]['fx_base'] == 'hex':
                 y_str = bin2hex_vec(y_bin_str, WI)
-            else:  # 'bin'
+            elif y_bin_str is not None:  # 'bin'
                 # insert radix point if required
                 if fb.fil[0]['qfrmt'] == 'qint':
                     y_str = y_bin_str
                 else:
-                    y_str = insert_binary_point(y_bin_str, WI)
+                    y_str = _insert_binary_point(y_bin_str, WI)
         else:
             raise Exception(f"""Unknown number format "{fb.fil[0]['fx_base']}"!""")
 
@@ -1084,9 +1588,9 @@ class Fixed(object):
 ########################################
 
 # --------------------------------------------------------------------------
-def quant_coeffs(coeffs: iterable, QObj, recursive: bool = False) -> list:
+def quant_coeffs(coeffs: iterable, QObj, recursive: bool = False) -> np.ndarray:
     """
-    Quantize the coefficients, scale and convert them to a list of integers,
+    Quantize the coefficients, scale and convert them to an array of integers,
     using the quantization settings of `Fixed()` instance QObj.
 
     Parameters
@@ -1103,14 +1607,14 @@ def quant_coeffs(coeffs: iterable, QObj, recursive: bool = False) -> list:
 
     Returns
     -------
-    A list of integer coeffcients, quantized and scaled with the settings
-    of the quantization object dict
+    An ndarray of integer coeffcients (dtype float), quantized and scaled with
+    the settings of the quantization object dict. Use `.tolist()` when a list
+    is required.
 
     """
     logger.debug("quant_coeffs")
-    # always use decimal display format for coefficient quantization
-    disp_frmt_tmp = fb.fil[0]['fx_base']
-    fb.fil[0]['fx_base'] = 'dec'
+    # `fixp()` doesn't depend on the display format `fb.fil[0]['fx_base']`,
+    # there is no need to switch it to 'dec' temporarily
     QObj.resetN()  # reset all overflow counters
 
     if coeffs is None:
@@ -1122,14 +1626,13 @@ def quant_coeffs(coeffs: iterable, QObj, recursive: bool = False) -> list:
 #        QObj.q_dict['scale'] = 1 << QObj.q_dict['WF']
     if recursive:
         # quantize coefficients except for first
-        coeff_q = [1] + list(QObj.fixp(coeffs[1:]))
+        coeff_q = np.concatenate(([1.], QObj.fixp(coeffs[1:])))
     else:
         # quantize all coefficients
-        coeff_q = list(QObj.fixp(coeffs))
+        coeff_q = QObj.fixp(coeffs)
 
     # self.update_ovfl_cnt()  # update display of overflow counter and MSB / LSB
 
-    fb.fil[0]['fx_base'] = disp_frmt_tmp  # restore previous display setting
     return coeff_q
 
 
@@ -9,12 +9,13 @@
 """
 Library with classes and functions for file and text IO
 """
-import os, re, io
+import os, sys, re, io
 import copy
 import csv
 import wave
 import datetime
 import warnings
+from functools import lru_cache
 from typing import TextIO, Tuple  # replace by built-in tuple from Py 3.9
 
 import pickle
@@ -27,7 +28,7 @@ try:
 except ImportError:
     xlwt = None
 try:
-    import xlsx
+    import xlsxwriter as xlsx
 except ImportError:
     xlsx = None
 
@@ -69,6 +70,13 @@ file_filters_dict = {
 pattern_num_chars = re.compile('[eEjJ()0-9,\.\+\-\s]+$')
 # regex pattern that identifies characters and their position *not* specified
 pattern_no_num = re.compile('(?![eEjJ()0-9,\.\+\-\s])')
+# regex pattern that matches file extensions in brackets like '(*.txt)'
+pattern_file_ext = re.compile(r'\([^\)]+\)')
+
+# pickle protocol for saving filters, protocol 5 requires Python >= 3.8
+PICKLE_PROTOCOL = 5 if sys.version_info >= (3, 8) else pickle.HIGHEST_PROTOCOL
+# buffer size for reading / writing filter files, pickle reads / writes many small chunks
+FILTER_BUF_SIZE = 1 << 20
 
 # ------------------------------------------------------------------------------
 def prune_file_ext(file_type: str) -> str:
@@ -76,7 +84,7 @@ def prune_file_ext(file_type: str) -> str:
     Prune file extension, e.g. 'Text file' from 'Text file (\*.txt)' returned
     by QFileDialog file type description.
 
-    Pruning is achieved with the following regular expression:
+    Pruning is achieved with the following (precompiled) regular expression:
 
     .. code::
 
@@ -105,7 +113,7 @@ def prune_file_ext(file_type: str) -> str:
     - '(' must be escaped as '\\\('
     """
 
-    return re.sub('\([^\)]+\)', '', file_type)
+    return pattern_file_ext.sub('', file_type)
 
 
 # ------------------------------------------------------------------------------
@@ -215,7 +223,15 @@ def select_file(parent: object, title: str = "", mode: str = "r",
 
     file_filters, last_file_filter = create_file_filters(file_types=file_types)
 
-    dlg = QFileDialog(parent)  # create instance for QFileDialog
+    # Reuse the file dialog instance of the parent widget (it is deleted together
+    # with the parent), constructing a QFileDialog takes noticeable time
+    dlg = getattr(parent, '_file_dlg', None)
+    if dlg is None:
+        dlg = QFileDialog(parent)  # create instance for QFileDialog
+        if parent is not None:
+            parent._file_dlg = dlg
+    else:
+        dlg.selectFile("")  # clear file name from last dialog
     dlg.setDirectory(dirs.last_file_dir)
     if mode in {"r", "rb"}:
         if title == "":
@@ -1084,7 +1100,15 @@ def save_data_np(file_name: str, file_type: str, data: np.ndarray,
             delimiter = params['CSV']['delimiter'].lower()
             if delimiter == 'auto':
                 delimiter = ','
-            np.savetxt(file_name, data, fmt=fmt, delimiter=delimiter)
+            data = np.asarray(data)
+            if fmt.count('%') == 1 and data.dtype.kind in {'b', 'i', 'u', 'f'}:
+                # Format all rows with a single string operation, producing the same
+                # output as `np.savetxt()` without its Python loop over the rows
+                row_fmt = delimiter.join([fmt] * (data.shape[1] if data.ndim == 2 else 1))
+                with open(file_name, 'w', encoding='latin1') as f:
+                    f.write((row_fmt + '\n') * len(data) % tuple(data.ravel().tolist()))
+            else:
+                np.savetxt(file_name, data, fmt=fmt, delimiter=delimiter)
             # TODO: Integer formats like int16 should be stored as integers
         else:
             logger.error(f"File type {file_type} not supported!")
@@ -1217,9 +1241,22 @@ def save_data_csv(parent: object, data: str, fkey: str = "", title: str = "Expor
                 logger.error("Error converting coefficient data:\n{0}".format(np_data))
                 return None
 
+            if file_type in {'xls', 'xlsx'}:
+                # table rows with the columns 'b' and 'a' for the spreadsheet formats,
+                # converted once to native floats (strings e.g. for complex values)
+                rows = np.atleast_2d(np_data)[:, :2]
+                try:
+                    rows = rows.astype(float)
+                except ValueError:
+                    pass
+                rows = rows.tolist()
+
             with open(file_name, 'wb') as f:
                 if file_type == 'mat':
-                    savemat(f, mdict={fkey: np_data})
+                    # explicit MATLAB 5 format without compression, the array is
+                    # made C-contiguous beforehand
+                    savemat(f, mdict={fkey: np.ascontiguousarray(np_data)},
+                            format='5', do_compression=False, oned_as='column')
                     # newline='\n', header='', footer='', comments='# ', fmt='%.18e'
                 elif file_type == 'npy':
                     np.save(f, np_data)  # can only store one array
@@ -1237,15 +1274,19 @@ def save_data_csv(parent: object, data: str, fkey: str = "", title: str = "Expor
                     bold = xlwt.easyxf('font: bold 1')
                     worksheet.write(0, 0, 'b', bold)
                     worksheet.write(0, 1, 'a', bold)
-                    for col in range(2):
-                        for row in range(np.shape(data)[1]):
-                            worksheet.write(row+1, col, data[col][row])  # vertical
+                    for row, vals in enumerate(rows, start=1):  # vertical
+                        for col, val in enumerate(vals):
+                            worksheet.write(row, col, val)
                     workbook.save(f)
 
                 elif file_type == 'xlsx':
                     # from https://pypi.python.org/pypi/XlsxWriter
                     # Create an new Excel file and add a worksheet.
-                    workbook = xlsx.Workbook(f)
+                    # Rows are written in order, flush them to disk one at a time;
+                    # don't interpret strings as formulas or urls
+                    workbook = xlsx.Workbook(f, {'constant_memory': True,
+                                                 'strings_to_formulas': False,
+                                                 'strings_to_urls': False})
                     worksheet = workbook.add_worksheet()
                     # Widen the first column to make the text clearer.
                     worksheet.set_column('A:A', 20)
@@ -1255,11 +1296,9 @@ def save_data_csv(parent: object, data: str, fkey: str = "", title: str = "Expor
                     worksheet.write('A1', 'b', bold)
                     worksheet.write('B1', 'a', bold)
 
-                    # Write some numbers, with row/column notation.
-                    for col in range(2):
-                        for row in range(np.shape(data)[1]):
-                            worksheet.write(row+1, col, data[col][row])  # columns
-        #                    worksheet.write(row, col, coeffs[col][row])  # rows
+                    # Write the numbers row by row, with row/column notation.
+                    for row, vals in enumerate(rows, start=1):
+                        worksheet.write_row(row, 0, vals)  # columns
 
                     # Insert an image - useful for documentation export ?!.
         #            worksheet.insert_image('B5', 'logo.png')
@@ -1384,6 +1423,27 @@ def coe_header(title: str) -> str:
     return header
 
 
+# ------------------------------------------------------------------------------
+@lru_cache(maxsize=4)
+def _fixed_cached(qfrmt: str, fx_base: str, q_items: tuple) -> fx.Fixed:
+    """
+    Return a fixpoint object constructed from the quantizer dict items `q_items`.
+    `qfrmt` and `fx_base` are only passed as keys for the cache as the fixpoint
+    object is constructed with the settings of `fb.fil[0]`.
+    """
+    return fx.Fixed(dict(q_items))
+
+
+def coeff_quantizer() -> fx.Fixed:
+    """
+    Return a fixpoint object for the coefficient quantizer dict
+    `fb.fil[0]['fxqc']['QCB']`, reusing the object of the last call when neither
+    the dict nor the number format have changed.
+    """
+    return _fixed_cached(fb.fil[0]['qfrmt'], fb.fil[0]['fx_base'],
+                         tuple(sorted(fb.fil[0]['fxqc']['QCB'].items())))
+
+
 # ------------------------------------------------------------------------------
 def export_coe_xilinx(f: TextIO) -> bool:
     """
@@ -1392,7 +1452,7 @@ def export_coe_xilinx(f: TextIO) -> bool:
 
     Returns error status (False if the file was saved successfully)
     """
-    qc = fx.Fixed(fb.fil[0]['fxqc']['QCB'])  # instantiate fixpoint object
+    qc = coeff_quantizer()  # fixpoint object
 
     if qc.q_dict['WF'] != 0  and fb.fil[0]['qfrmt'] != 'qint':
         logger.error("Fractional formats are not supported!")
@@ -1417,10 +1477,7 @@ def export_coe_xilinx(f: TextIO) -> bool:
     exp_str += "\nRadix = {0};\n".format(coe_radix)
       # quantized wordlength
     exp_str += f"Coefficient_width = {qc.q_dict['WI'] + qc.q_dict['WF'] + 1};\n"
-    coeff_str = "CoefData = "
-    for b in bq:
-        coeff_str += str(b) + ",\n"
-    exp_str += coeff_str[:-2] + ";"  # replace last "," by ";"
+    exp_str += "CoefData = " + ",\n".join(map(str, bq)) + ";"
 
     f.write(exp_str)
 
@@ -1435,7 +1492,7 @@ def export_coe_microsemi(f: TextIO) -> bool:
     For (anti)symmetric filter only one half of the coefficients must be
     specified?
     """
-    qc = fx.Fixed(fb.fil[0]['fxqc']['QCB'])  # instantiate fixpoint object
+    qc = coeff_quantizer()  # fixpoint object
 
     if qc.q_dict['WF'] != 0  and fb.fil[0]['qfrmt'] != 'qint':
         logger.error("Fractional formats are not supported!")
@@ -1449,11 +1506,7 @@ def export_coe_microsemi(f: TextIO) -> bool:
     # Quantize coefficients to decimal integer format, returning an array of strings
     bq = qc.float2frmt(fb.fil[0]['ba'][0])
 
-    coeff_str = "coefficient_set_1\n"
-    for b in bq:
-        coeff_str += str(b) + "\n"
-
-    f.write(coeff_str)
+    f.write("coefficient_set_1\n" + "".join([str(b) + "\n" for b in bq]))
 
     return False
 
@@ -1464,7 +1517,7 @@ def export_coe_vhdl_package(f: TextIO) -> bool:
     Save FIR filter coefficients as a VHDL package '\*.vhd', specifying
     the number base and the quantized coefficients (decimal or hex integer).
     """
-    qc = fx.Fixed(fb.fil[0]['fxqc']['QCB'])  # instantiate fixpoint object
+    qc = coeff_quantizer()  # fixpoint object
     if fb.fil[0]['qfrmt'] == 'float' or fb.fil[0]['qfrmt'] == 'qint'\
         or fb.fil[0]['qfrmt'] == 'qint'and qc.q_dict['WF'] == 0:
             pass
@@ -1509,10 +1562,7 @@ def export_coe_vhdl_package(f: TextIO) -> bool:
         exp_str += f"range {-1 << WO-1} to {(1 << WO-1) - 1};\n\n"
     exp_str += "constant coeff : coeff_type := "
 
-    coeff_str = "(\n"
-    for b in bq:
-        coeff_str += "\t" + pre + str(b) + post + ",\n"
-    exp_str += coeff_str[:-2] + ");\n\n"  # replace last "," by ");"
+    exp_str += "(\n" + ",\n".join([f"\t{pre}{b}{post}" for b in bq]) + ");\n\n"
 
     exp_str += "end coeff_package;"
 
@@ -1556,22 +1606,25 @@ def load_filter(self) -> int:
 
 
     try:
-        with io.open(file_name, 'rb') as f:
+        with io.open(file_name, 'rb', buffering=FILTER_BUF_SIZE) as f:
             if file_type == 'npz':
                 # array containing dict, dtype 'object':
                 a = np.load(f, allow_pickle=True)
 
                 logger.debug(f"Entries in {file_name}:\n{a.files}")
                 for key in sorted(a):
+                    # each access a[key] reads and parses the member from the
+                    # zip archive again, read it only once
+                    val = a[key]
                     # logger.warning(
                     #     f"key: {key}|{type(key).__name__}|"
-                    #     f"{type(a[key]).__name__}|{a[key]}")
-                    if np.ndim(a[key]) == 0:
+                    #     f"{type(val).__name__}|{val}")
+                    if np.ndim(val) == 0:
                         # scalar objects may be extracted with the item() method
-                        fb.fil[0][key] = a[key].item()
+                        fb.fil[0][key] = val.item()
                     else:
                         # array objects are converted to list first
-                        fb.fil[0][key] = a[key].tolist()
+                        fb.fil[0][key] = val.tolist()
             elif file_type == 'pkl':
                 fb.fil[0] = pickle.load(f)
             else:
@@ -1641,11 +1694,13 @@ def save_filter(self):
         return -1  # operation cancelled or other error
     err = False
     try:
-        with io.open(file_name, 'wb') as f:
+        with io.open(file_name, 'wb', buffering=FILTER_BUF_SIZE) as f:
             if file_type == 'npz':
                 np.savez(f, **fb.fil[0])
             elif file_type == 'pkl':
-                pickle.dump(fb.fil[0], f)  # save in default pickle version
+                # Protocol 5 (PEP 574) writes the data of numpy arrays directly
+                # from their buffers instead of copying them to bytes objects first
+                pickle.dump(fb.fil[0], f, protocol=PICKLE_PROTOCOL)
             else:
                 err = True
                 logger.error('Unknown file type "{0}"'.format(file_type))
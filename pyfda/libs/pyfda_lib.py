@@ -116,6 +116,12 @@ try:
 except ImportError:
     MODULES.update({'amaranth': {'V_AM': "not found"}})
 
+try:
+    from numba import __version__ as V_NUMBA
+    MODULES.update({'numba': {'V_NUMBA': V_NUMBA}})
+except ImportError:
+    MODULES.update({'numba': {'V_NUMBA': "not found"}})
+
 
 # Remove module names as keys and return a dict with items like
 #  {'V_MPL':'3.3.1', ...}
@@ -952,7 +958,7 @@ def cround(x, n_dig=0):
     x = np.real_if_close(x, 1e-15)
     if n_dig > 0:
         if np.iscomplex(x):
-            x = np.complex(np.around(x.real, n_dig), np.around(x.imag, n_dig))
+            x = complex(np.around(x.real, n_dig), np.around(x.imag, n_dig))
         else:
             x = np.around(x, n_dig)
     return x
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the pyFDA project hosted at https://github.com/chipmuenk/pyfda
+#
+# Copyright © pyFDA Project Contributors
+# Licensed under the terms of the MIT License
+# (see file LICENSE in root directory for details)
+
+"""
+Test suite for the fixpoint IIR DF1 filter `IIR_DF1_pyfixp`: The numba kernels
+(float and integer arithmetics), the NumPy sample loop with and without output
+lookup table and the `lfilter` shortcut have to give identical results.
+"""
+
+import copy
+import unittest
+from unittest import mock
+import numpy as np
+import scipy.signal as sig
+import pyfda.filterbroker as fb
+from pyfda.libs import pyfda_fix_lib as fx
+from pyfda.fixpoint_widgets.iir_df1 import iir_df1_pyfixp as iir
+
+
+def q(WI, WF, ovfl='sat', quant='round'):
+    """ Return a quantizer dict """
+    return {'WI': WI, 'WF': WF, 'ovfl': ovfl, 'quant': quant}
+
+
+def reference_filter(p, x_blocks):
+    """
+    Filter the stimuli blocks `x_blocks` sample by sample with quantizers of the
+    settings in `p` and the coefficients in `fb.fil[0]['ba']`. Return a list with
+    the outputs of the blocks, the final registers `zi_b`, `zi_a` and the
+    accumulator and output quantizers.
+    """
+    p = copy.deepcopy(p)
+    # create the quantizers in the same order as `IIR_DF1_pyfixp.init()`, the
+    # partial product format is derived from the completed quantizer dicts
+    Q_b, Q_a, Q_acc, Q_O = [fx.Fixed(p[k]) for k in ('QCB', 'QCA', 'QACC', 'QO')]
+    Q_mul = fx.Fixed(iir._q_mul_dict(p))
+    b = np.asarray(fx.quant_coeffs(fb.fil[0]['ba'][0], Q_b))
+    # a[0] = 1 is not used
+    a = np.asarray(fx.quant_coeffs(fb.fil[0]['ba'][1], Q_a, recursive=True))[1:]
+    L = len(b)
+    zi_b = np.zeros(L - 1)  # transversal registers, oldest sample first
+    zi_a = np.zeros(L - 1)  # recursive registers, newest output first
+    y_blocks = []
+    for x in x_blocks:
+        acc = np.zeros(len(x))
+        for k, x_k in enumerate(x):
+            # b[0] is multiplied with the oldest sample
+            zi_b = np.append(zi_b, x_k)
+            xb_q = Q_mul.fixp(zi_b * b)
+            xa_q = Q_mul.fixp(zi_a * a)
+            acc[k] = Q_acc.fixp(np.sum(xb_q) - np.sum(xa_q))
+            zi_b = zi_b[1:]
+            if L > 1:
+                zi_a = np.concatenate(([Q_O.fixp(acc[k])], zi_a[:-1]))
+        y_blocks.append(Q_O.fixp(acc))
+    return y_blocks, zi_b, zi_a, Q_acc, Q_O
+
+
+class TestIIR_DF1(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(1)
+        self.qfrmt = fb.fil[0]['qfrmt']
+        self.ba = fb.fil[0]['ba']
+
+    def tearDown(self):
+        fb.fil[0]['qfrmt'] = self.qfrmt
+        fb.fil[0]['ba'] = self.ba
+
+    def run_paths(self, p, x_blocks):
+        """
+        Filter the stimuli blocks `x_blocks` with `fxfilter()` in successive
+        calls, with and without numba, and compare the outputs, registers and
+        overflow counters with each other and with `reference_filter()`.
+        """
+        results = []
+        for numba in ((True, False) if fx.NUMBA else (False,)):
+            with mock.patch.object(iir, 'NUMBA', numba),\
+                    mock.patch.object(fx, 'NUMBA', numba):
+                dut = iir.IIR_DF1_pyfixp(copy.deepcopy(p))
+                y_blocks = [dut.fxfilter(x=x)[0] for x in x_blocks]
+            results.append((y_blocks, dut.zi_b, dut.zi_a,
+                            [(Q.N, Q.N_over, Q.N_over_pos, Q.N_over_neg)
+                             for Q in (dut.Q_acc, dut.Q_O)]))
+
+        for y_blocks, zi_b, zi_a, cnt in results[1:]:
+            for y, y_0 in zip(y_blocks, results[0][0]):
+                np.testing.assert_array_equal(y, y_0)
+            np.testing.assert_array_equal(zi_b, results[0][1])
+            np.testing.assert_array_equal(zi_a, results[0][2])
+            self.assertEqual(cnt, results[0][3])
+
+        y_ref, zi_b_ref, zi_a_ref, Q_acc, Q_O = reference_filter(p, x_blocks)
+        y_blocks, zi_b, zi_a, cnt = results[0]
+        for y, y_r in zip(y_blocks, y_ref):
+            np.testing.assert_array_equal(y, y_r)
+        np.testing.assert_array_equal(zi_b, zi_b_ref)
+        np.testing.assert_array_equal(zi_a, zi_a_ref)
+        # overflows of the partial products are added to `Q_acc.N_over`, compare
+        # only the accumulator overflows
+        self.assertEqual(cnt[0][:1] + cnt[0][2:], (Q_acc.N, Q_acc.N_over_pos, Q_acc.N_over_neg))
+        self.assertEqual(cnt[1], (Q_O.N, Q_O.N_over, Q_O.N_over_pos, Q_O.N_over_neg))
+
+    def stimuli(self, p, lengths, on_grid=True, ampl=1.):
+        """ Return random stimuli blocks, quantized with `p['QI']` when `on_grid` """
+        x_blocks = [self.rng.uniform(-ampl, ampl, n) for n in lengths]
+        if on_grid:
+            Q_I = fx.Fixed(copy.deepcopy(p['QI']))
+            x_blocks = [Q_I.fixp(x) for x in x_blocks]
+        return x_blocks
+
+    def params(self, ovfl, quant, WI_acc=0):
+        """ Return filter parameters for the coefficients in `fb.fil[0]['ba']` """
+        a = fb.fil[0]['ba'][1]
+        WI_a = int(np.ceil(np.log2(np.max(np.abs(a))))) + 1
+        return {'QCB': q(0, 9), 'QCA': q(WI_a, 9), 'QI': q(0, 7),
+                'QACC': q(WI_acc, 12, ovfl, quant), 'QO': q(1, 8, ovfl, quant)}
+
+    def test_qfrac(self):
+        """ Fractional format, inputs on and off the grid of `QI` """
+        fb.fil[0]['qfrmt'] = 'qfrac'
+        for ba in (sig.butter(2, 0.2), sig.ellip(3, 1, 40, 0.3)):
+            fb.fil[0]['ba'] = [list(ba[0]), list(ba[1])]
+            for ovfl, quant in (('sat', 'round'), ('wrap', 'floor'), ('sat', 'fix'),
+                                ('none', 'round')):
+                p = self.params(ovfl, quant)
+                for on_grid in (True, False):
+                    self.run_paths(p, self.stimuli(p, (64, 1, 37), on_grid, ampl=4.))
+
+    def test_qint(self):
+        """ Integer format """
+        fb.fil[0]['qfrmt'] = 'qint'
+        fb.fil[0]['ba'] = [list(c) for c in sig.butter(2, 0.2)]
+        for ovfl, quant in (('sat', 'round'), ('wrap', 'floor')):
+            p = self.params(ovfl, quant, WI_acc=4)
+            self.run_paths(p, self.stimuli(p, (50, 13), on_grid=False))
+
+    def test_no_quantization(self):
+        """ Neither quantization nor overflow handling: `lfilter` shortcut """
+        fb.fil[0]['qfrmt'] = 'qfrac'
+        # FIR filter in IIR form, all sums are exact
+        fb.fil[0]['ba'] = [[0.25, 0.5, 0.25], [1, 0, 0]]
+        p = self.params('none', 'none')
+        self.run_paths(p, self.stimuli(p, (40, 3)))
+
+    def test_first_order(self):
+        """ L = 1, no recursive registers: output is requantized once per sample """
+        fb.fil[0]['qfrmt'] = 'qfrac'
+        fb.fil[0]['ba'] = [[0.9], [1.]]
+        p = self.params('sat', 'round')
+        self.run_paths(p, self.stimuli(p, (21, 5), ampl=1.5))
+
+    def test_long_input(self):
+        """ More stimuli than processed per call of the numba kernels """
+        fb.fil[0]['qfrmt'] = 'qfrac'
+        fb.fil[0]['ba'] = [list(c) for c in sig.butter(2, 0.05)]
+        self.assertGreater(5000, iir.TILE_N)
+        for ovfl, quant in (('sat', 'round'), ('wrap', 'floor')):
+            p = self.params(ovfl, quant)
+            for on_grid in (True, False):
+                self.run_paths(p, self.stimuli(p, (5000, 100), on_grid, ampl=2.))
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# run tests with python -m pyfda.tests.test_iir_df1
@@ -11,6 +11,7 @@ Test suite for the pyfda_fix_lib classes and methods
 """
 
 import unittest
+import itertools
 import numpy as np
 import pyfda.filterbroker as fb
 from pyfda.libs import pyfda_fix_lib as fix_lib
@@ -207,6 +208,67 @@ class TestSequenceFunctions(unittest.TestCase):
         yq_list_goal = [7.0, -8.0, -4, 0, 4, 7, 7.5, -8, -7.5]
         self.assertEqual(yq_list, yq_list_goal)
 
+    def test_fixp_paths(self):
+        """
+        Compare the implementations of fixp(): the numba kernel (arrays, when
+        numba is installed), the specialized function for real scalars and the
+        general NumPy code, which is used for both when debug logging is enabled.
+        Results including the sign of zero, overflow counters and the types of
+        scalar results must be identical.
+        """
+        y = np.array([0., -0., 0.5, -0.5, 1.5, -1.5, 2.5, -2.5, 0.25, -0.25, 0.75,
+                      -0.75, 1., -1., 3.5, -3.5, 7.25, -8.5, 100.5, -100.5])
+
+        def run(q_dict, scaling, scalar):
+            Q = fix_lib.Fixed(dict(q_dict))
+            if scalar:
+                yq = []
+                for v in y:
+                    yq.append(Q.fixp(float(v), scaling=scaling))
+                    # result types must not depend on the path taken
+                    self.assertIs(type(yq[-1]), float)
+                    self.assertIs(type(Q.ovr_flag), int)
+                yq = np.array(yq)
+            else:
+                yq = Q.fixp(y, scaling=scaling)
+            return yq, (Q.N, Q.N_over, Q.N_over_pos, Q.N_over_neg)
+
+        for qfrmt, ovfl, quant, scaling, WI, WF in itertools.product(
+                ('qfrac', 'qint'), ('sat', 'wrap', 'none'),
+                ('round', 'floor', 'fix', 'ceil', 'rint', 'none'), ('mult', 'div'),
+                (0, 2), (0, 1, 3)):
+            fb.fil[0].update({'qfrmt': qfrmt})
+            q_dict = {'WI': WI, 'WF': WF, 'ovfl': ovfl, 'quant': quant}
+            yq_ref, cnt_ref = run(q_dict, scaling, False)  # numba kernel
+            results = [run(q_dict, scaling, True)]  # specialized scalar function
+            with self.assertLogs(fix_lib.logger, level='DEBUG'):
+                # general NumPy code for arrays and scalars
+                results += [run(q_dict, scaling, False), run(q_dict, scaling, True)]
+            for yq, cnt in results:
+                msg = f"{qfrmt}, {q_dict}, scaling = {scaling}"
+                np.testing.assert_array_equal(yq, yq_ref, err_msg=msg)
+                np.testing.assert_array_equal(np.signbit(yq), np.signbit(yq_ref),
+                                              err_msg=msg)
+                self.assertEqual(cnt, cnt_ref, msg=msg)
+
+    def test_fixp_ndarray(self):
+        """
+        Quantize a float ndarray (bulk path) and a list with the same values
+        """
+        fb.fil[0].update({'qfrmt': 'qfrac', 'fx_base': 'dec'})
+        q_dict = {'WI':0, 'WF':3, 'ovfl':'none', 'quant':'none'}
+        self.myQ.set_qdict(q_dict)
+        yq_arr = self.myQ.fixp(np.asarray(self.y_list))
+        np.testing.assert_array_equal(yq_arr, np.asarray(self.y_list))
+        np.testing.assert_array_equal(yq_arr, self.myQ.fixp(self.y_list))
+
+        q_dict = {'WI':0, 'WF':3, 'ovfl':'sat', 'quant':'round'}
+        self.myQ.set_qdict(q_dict)
+        yq_arr = self.myQ.fixp(np.asarray(self.y_list))
+        yq_arr_goal = [-1, -1, -0.5, 0, 0.5, 0.875, 0.875, 0.875, 0.875]
+        np.testing.assert_array_equal(yq_arr, yq_arr_goal)
+        np.testing.assert_array_equal(yq_arr, list(map(self.myQ.fixp, self.y_list)))
+
 
     def test_float2frmt_bin(self):
         """